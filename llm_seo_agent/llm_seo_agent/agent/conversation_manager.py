@@ -1,34 +1,117 @@
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+import inspect
+from typing import AsyncIterator, Awaitable, Dict, List, Any, Optional, Callable, Tuple
 from .seo_consultant import SEOConsultant
 from llm_seo_agent.utils.data_models import ConversationRole
 
 
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "dismissed": "❌",
+}
+
+_PRIORITY_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢",
+}
+
+_HELP_MESSAGE = """
+🤖 **SEO Agent Commands:**
+
+**Analysis Commands:**
+- Just ask! "Analyze my website: example.com"
+- "Compare me to competitor.com"
+- "Check my AI search performance"
+
+**Progress Management:**
+- `/status` - View your SEO progress
+- `/recommendations` or `/recs` - See your recommendations
+- `/complete <rec_id>` - Mark recommendation as completed
+- `/progress <rec_id>` - Mark recommendation as in progress
+
+**Session Management:**
+- `/new` or `/restart` - Start fresh conversation
+- `/export` - Export conversation history
+- `/help` - Show this message
+
+**Examples:**
+- "My website isn't showing up in ChatGPT responses"
+- "Analyze example.com for AI search optimization"
+- "How do I improve my content for AI citations?"
+"""
+
+_GOODBYE_MESSAGE = (
+    "Thanks for the SEO consultation! Feel free to return anytime for more optimization "
+    "advice. Your progress has been saved."
+)
+
+
 class ConversationManager:
     def __init__(self, claude_api_key: Optional[str] = None):
         self.consultant = SEOConsultant(claude_api_key=claude_api_key)
         self.is_active = False
         self.message_handlers: List[Callable] = []
 
+        # Exact-match slash commands -> async handlers
+        self._commands: Dict[str, Callable[[], Awaitable[str]]] = {
+            '/help': self._cmd_help,
+            '/status': self._cmd_status,
+            '/recommendations': self._show_recommendations,
+            '/recs': self._show_recommendations,
+            '/export': self._export_conversation,
+            '/new': self.start_session,
+            '/restart': self.start_session,
+        }
+
+        # Commands taking a recommendation id -> status to set
+        self._prefix_commands: List[Tuple[str, str]] = [
+            ('/complete ', "completed"),
+            ('/progress ', "in_progress"),
+        ]
+
     def add_message_handler(self, handler: Callable):
         """Add a handler that gets called for each message exchange."""
         self.message_handlers.append(handler)
 
+    async def _notify(self, event: str, payload: Dict[str, Any]):
+        """Run all message handlers for an event; async handlers run concurrently.
+
+        Handlers may be plain functions, which skips creating a coroutine for
+        events they ignore.
+        """
+        pending = []
+        for handler in self.message_handlers:
+            try:
+                result = handler(event, payload)
+            except Exception as e:
+                print(f"Handler error: {e}")
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+
+        if not pending:
+            return
+
+        results = await asyncio.gather(*pending, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Handler error: {result}")
+
     async def start_session(self, user_id: str = None, website_url: str = None) -> str:
         """Start a new conversation session."""
         self.is_active = True
         welcome_message = await self.consultant.start_conversation(user_id, website_url)
 
         # Notify handlers
-        for handler in self.message_handlers:
-            try:
-                await handler("session_start", {
-                    "user_id": user_id,
-                    "website_url": website_url,
-                    "welcome_message": welcome_message
-                })
-            except Exception as e:
-                print(f"Handler error: {e}")
+        await self._notify("session_start", {
+            "user_id": user_id,
+            "website_url": website_url,
+            "welcome_message": welcome_message
+        })
 
         return welcome_message
 
@@ -45,74 +128,61 @@ class ConversationManager:
         response = await self.consultant.chat(user_input)
 
         # Notify handlers
-        for handler in self.message_handlers:
-            try:
-                await handler("message_exchange", {
-                    "user_message": user_input,
-                    "assistant_response": response
-                })
-            except Exception as e:
-                print(f"Handler error: {e}")
+        await self._notify("message_exchange", {
+            "user_message": user_input,
+            "assistant_response": response
+        })
 
         return response
 
-    async def _handle_command(self, command: str) -> str:
-        """Handle special commands like /help, /status, etc."""
-        command = command.lower().strip()
+    async def process_message_stream(self, user_input: str) -> AsyncIterator[str]:
+        """Like process_message, but yields the response in chunks as it is generated."""
+        if not self.is_active:
+            await self.start_session()
 
-        if command == '/help':
-            return self._get_help_message()
+        # Commands are answered in one piece
+        if user_input.startswith('/'):
+            yield await self._handle_command(user_input)
+            return
+
+        chunks = []
+        async for chunk in self.consultant.chat_stream(user_input):
+            chunks.append(chunk)
+            yield chunk
 
-        elif command == '/status':
-            progress = await self.consultant.get_user_progress()
-            return self._format_status(progress)
+        # Notify handlers
+        await self._notify("message_exchange", {
+            "user_message": user_input,
+            "assistant_response": "".join(chunks)
+        })
 
-        elif command == '/recommendations' or command == '/recs':
-            return await self._show_recommendations()
+    async def _handle_command(self, command: str) -> str:
+        """Handle special commands like /help, /status, etc."""
+        command = command.lower().strip()
 
-        elif command.startswith('/complete '):
-            rec_id = command.replace('/complete ', '').strip()
-            return await self.consultant.update_recommendation_status(rec_id, "completed")
+        handler = self._commands.get(command)
+        if handler:
+            return await handler()
 
-        elif command.startswith('/progress '):
-            rec_id = command.replace('/progress ', '').strip()
-            return await self.consultant.update_recommendation_status(rec_id, "in_progress")
+        for prefix, status in self._prefix_commands:
+            if command.startswith(prefix):
+                rec_id = command[len(prefix):].strip()
+                return await self.consultant.update_recommendation_status(rec_id, status)
 
-        elif command == '/export':
-            return await self._export_conversation()
+        return "Unknown command. Type /help to see available commands."
 
-        elif command == '/new' or command == '/restart':
-            return await self.start_session()
+    async def _cmd_help(self) -> str:
+        """Handle /help."""
+        return self._get_help_message()
 
-        else:
-            return "Unknown command. Type /help to see available commands."
+    async def _cmd_status(self) -> str:
+        """Handle /status."""
+        progress = await self.consultant.get_user_progress()
+        return self._format_status(progress)
 
     def _get_help_message(self) -> str:
         """Return help message with available commands."""
-        return """
-🤖 **SEO Agent Commands:**
-
-**Analysis Commands:**
-- Just ask! "Analyze my website: example.com"
-- "Compare me to competitor.com"
-- "Check my AI search performance"
-
-**Progress Management:**
-- `/status` - View your SEO progress
-- `/recommendations` or `/recs` - See your recommendations
-- `/complete <rec_id>` - Mark recommendation as completed
-- `/progress <rec_id>` - Mark recommendation as in progress
-
-**Session Management:**
-- `/new` or `/restart` - Start fresh conversation
-- `/export` - Export conversation history
-- `/help` - Show this message
-
-**Examples:**
-- "My website isn't showing up in ChatGPT responses"
-- "Analyze example.com for AI search optimization"
-- "How do I improve my content for AI citations?"
-"""
+        return _HELP_MESSAGE
 
     def _format_status(self, progress: Dict[str, Any]) -> str:
         """Format user progress into readable message."""
@@ -122,20 +192,21 @@ class ConversationManager:
         recs = progress.get('recommendations', {})
         total_convos = progress.get('total_conversations', 0)
 
-        status_msg = f"""
-📊 **Your SEO Progress:**
-
-**Conversations:** {total_convos} sessions
-**Recommendations:** {recs.get('total', 0)} total
-  - ✅ Completed: {recs.get('completed', 0)}
-  - 🔄 In Progress: {recs.get('in_progress', 0)}
-  - ⏳ Pending: {recs.get('total', 0) - recs.get('completed', 0) - recs.get('in_progress', 0)}
-
-**Completion Rate:** {recs.get('completion_rate', 0):.1f}%
-**Website Analyses:** {progress.get('website_analyses', 0)}
-"""
-
-        return status_msg.strip()
+        pending = recs.get('total', 0) - recs.get('completed', 0) - recs.get('in_progress', 0)
+        lines = [
+            "📊 **Your SEO Progress:**",
+            "",
+            f"**Conversations:** {total_convos} sessions",
+            f"**Recommendations:** {recs.get('total', 0)} total",
+            f"  - ✅ Completed: {recs.get('completed', 0)}",
+            f"  - 🔄 In Progress: {recs.get('in_progress', 0)}",
+            f"  - ⏳ Pending: {pending}",
+            "",
+            f"**Completion Rate:** {recs.get('completion_rate', 0):.1f}%",
+            f"**Website Analyses:** {progress.get('website_analyses', 0)}",
+        ]
+
+        return "\n".join(lines)
 
     async def _show_recommendations(self) -> str:
         """Show current recommendations."""
@@ -147,32 +218,20 @@ class ConversationManager:
         if not recommendations:
             return "No recommendations yet. Let me analyze your website first!"
 
-        rec_msg = "📋 **Your SEO Recommendations:**\n\n"
+        lines = ["📋 **Your SEO Recommendations:**", ""]
 
         for rec in recommendations[-10:]:  # Show last 10
-            status_emoji = {
-                "pending": "⏳",
-                "in_progress": "🔄",
-                "completed": "✅",
-                "dismissed": "❌"
-            }
-
-            priority_emoji = {
-                "high": "🔴",
-                "medium": "🟡",
-                "low": "🟢"
-            }
-
-            emoji = status_emoji.get(rec.implementation_status, "⏳")
-            priority = priority_emoji.get(rec.priority, "🟡")
+            emoji = _STATUS_EMOJI.get(rec.implementation_status, "⏳")
+            priority = _PRIORITY_EMOJI.get(rec.priority, "🟡")
 
-            rec_msg += f"{emoji} {priority} **{rec.title}**\n"
-            rec_msg += f"   ID: `{rec.id[:8]}...` | Category: {rec.category}\n"
-            rec_msg += f"   {rec.description}\n\n"
+            lines.append(f"{emoji} {priority} **{rec.title}**")
+            lines.append(f"   ID: `{rec.id[:8]}...` | Category: {rec.category}")
+            lines.append(f"   {rec.description}")
+            lines.append("")
 
-        rec_msg += "💡 Use `/complete <rec_id>` or `/progress <rec_id>` to update status"
+        lines.append("💡 Use `/complete <rec_id>` or `/progress <rec_id>` to update status")
 
-        return rec_msg
+        return "\n".join(lines)
 
     async def _export_conversation(self) -> str:
         """Export conversation history."""
@@ -183,8 +242,8 @@ class ConversationManager:
         export_data = {
             "session_id": session.session_id,
             "created_at": session.created_at.isoformat(),
-            "user_profile": session.user_profile.dict(),
-            "total_messages": len(session.messages),
+            "user_profile": session.user_profile.model_dump(),
+            "total_messages": self.consultant.memory.message_count(session),
             "total_recommendations": len(session.recommendations),
             "export_timestamp": session.updated_at.isoformat()
         }
@@ -206,14 +265,13 @@ Recommendations: {export_data['total_recommendations']}
         self.is_active = False
 
         # Generate goodbye message
-        goodbye_message = "Thanks for the SEO consultation! Feel free to return anytime for more optimization advice. Your progress has been saved."
+        goodbye_message = _GOODBYE_MESSAGE
+
+        # Persist any debounced session changes before saying goodbye
+        await self.consultant.memory.flush()
 
         # Notify handlers
-        for handler in self.message_handlers:
-            try:
-                await handler("session_end", {"goodbye_message": goodbye_message})
-            except Exception as e:
-                print(f"Handler error: {e}")
+        await self._notify("session_end", {"goodbye_message": goodbye_message})
 
         return goodbye_message
 
@@ -232,7 +290,7 @@ Recommendations: {export_data['total_recommendations']}
             "session_id": session.session_id,
             "user_id": session.user_profile.user_id,
             "website_url": str(session.user_profile.website_url) if session.user_profile.website_url else None,
-            "message_count": len(session.messages),
+            "message_count": self.consultant.memory.message_count(session),
             "recommendation_count": len(session.recommendations),
             "last_updated": session.updated_at.isoformat()
         }
\ No newline at end of file
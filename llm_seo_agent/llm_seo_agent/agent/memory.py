@@ -1,8 +1,40 @@
-import json
+"""
+Conversation memory: sessions, their messages, recommendations and analyses.
+
+Each session is stored as a few files in storage_path, listed here in the
+order a reload applies them, next to one shared user index:
+
+- ``<id>.json``: snapshot of the session without its messages. Authoritative
+  for the profile and other session fields; recommendations and analyses are
+  as of the last save.
+- ``<id>.messages.jsonl``: append-only message log, the only copy of the
+  messages (the snapshot never holds them).
+- ``<id>.events.sealed.jsonl`` then ``<id>.events.jsonl``: recommendation and
+  analysis changes newer than the snapshot, replayed over it. Events are
+  idempotent, so ones the snapshot already contains are harmless. A snapshot
+  save moves the live log aside ("seals" it) and deletes the sealed log once
+  the snapshot is on disk.
+- ``_user_index.json``: user_id -> most recent session. Only a cache; it is
+  rebuilt from the snapshots when missing or unreadable.
+
+All writes go through the shared SessionWriteBatcher: snapshots and the index
+are replaced atomically and never by an older payload, and log lines are
+appended in order by its worker-thread drain.
+"""
+
+import asyncio
+import mmap
+import os
+import re
+import sys
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from pydantic import TypeAdapter
+from llm_seo_agent.utils import json_utils
+from llm_seo_agent.utils.write_batcher import SessionWriteBatcher
 from llm_seo_agent.utils.data_models import (
     ConversationSession,
     ConversationMessage,
@@ -14,6 +46,47 @@ from llm_seo_agent.utils.data_models import (
 )
 
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively since Python 3.11
+    _parse_iso = datetime.fromisoformat
+else:
+
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+# Shared by all ConversationMemory instances so saves from concurrent
+# sessions are coalesced into the same batches
+_write_batcher = SessionWriteBatcher()
+
+# Validates a whole window of logged messages in one pydantic-core call
+_MESSAGE_LIST = TypeAdapter(List[ConversationMessage])
+
+# Append-mostly list fields of a session snapshot whose item dumps are cached
+_SNAPSHOT_LIST_FIELDS = ('recommendations', 'website_analyses', 'competitor_analyses')
+
+# Top-level snapshot fields the user index is built from, matched in the raw bytes
+# (the keys are unique to ConversationSession/UserProfile)
+_SESSION_ID_RE = re.compile(rb'"session_id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_USER_ID_RE = re.compile(rb'"user_id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_UPDATED_AT_RE = re.compile(rb'"updated_at"\s*:\s*"([^"]*)"')
+# Legacy snapshots with inline messages, whose free-form metadata could repeat those keys
+_INLINE_MESSAGES_RE = re.compile(rb'"messages"\s*:\s*\[\s*\{')
+
+# Labels for messages in the rendered context; anything not from the user reads as the assistant
+_ROLE_LABELS = {ConversationRole.USER: "User"}
+
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "dismissed": "❌",
+}
+
+
 class ConversationMemory:
     def __init__(self, storage_path: str = "data/conversations"):
         self.storage_path = Path(storage_path)
@@ -21,6 +94,60 @@ class ConversationMemory:
         self.current_session: Optional[ConversationSession] = None
         self.retention_days = 30
 
+        # Debounced persistence: mutations mark the session dirty and a single
+        # delayed flush coalesces bursts of writes into one save.
+        self.flush_interval_ms = 500
+        self.flush_every = 20
+        self._dirty: bool = False
+        self._pending_mutations = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_wakeup: Optional[asyncio.Event] = None
+
+        # Indent session files for reading by hand (debugging); off by default
+        # since it makes every save larger and slower
+        self.pretty_json = False
+
+        # Recommendation and analysis changes are appended to a per-session event
+        # log rather than rewriting the snapshot; every compact_every events a
+        # snapshot save folds them in and the log starts over
+        self.compact_every = 50
+        self._pending_events = 0
+        self._seal_generations: Dict[str, int] = {}
+
+        # Only the most recent messages stay in memory; older ones live in the
+        # on-disk message log and are represented by a single summary message.
+        self.window_size = 200
+        self.compress_batch = 50
+
+        # user_id -> (session_id, updated_at) of the user's most recent session
+        self._index_path = self.storage_path / "_user_index.json"
+        self._user_index: Dict[str, Tuple[str, str]] = {}
+        self._load_user_index()
+
+        # Bounded LRU of recently saved/loaded sessions to skip disk reads
+        self._session_cache: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        self._cache_max = 128
+
+        # session_id -> serialized user profile; the profile rarely changes, so it
+        # is dumped once and reused until update_user_profile() invalidates it
+        self._profile_cache: Dict[str, Dict[str, Any]] = {}
+
+        # session_id -> field -> [(item, dump)] for _SNAPSHOT_LIST_FIELDS; items
+        # are matched by identity, so a save only dumps new or replaced entries
+        self._dump_cache: Dict[str, Dict[str, List[Tuple[Any, Dict[str, Any]]]]] = {}
+
+        # API-format copy of the current session's in-memory messages (None for
+        # system messages), kept in step with session.messages by add_message
+        # so get_message_history never re-converts the whole window
+        self._api_messages: List[Optional[Dict[str, str]]] = []
+        self._api_messages_session: Optional[ConversationSession] = None
+
+        # Last get_conversation_context() output per include_messages flag, with
+        # the inputs it was rendered from; _context_epoch is bumped whenever the
+        # profile or recommendations change
+        self._context_cache: Dict[bool, Tuple[Tuple[Any, ...], str]] = {}
+        self._context_epoch = 0
+
     def create_session(
         self, user_id: str, website_url: Optional[str] = None, industry: Optional[str] = None
     ) -> ConversationSession:
@@ -31,27 +158,20 @@ class ConversationMemory:
 
         session = ConversationSession(session_id=session_id, user_profile=user_profile)
 
+        self._flush_now()
         self.current_session = session
         self._save_session(session)
         return session
 
     def load_session(self, session_id: str) -> Optional[ConversationSession]:
         """Load an existing conversation session."""
-        session_file = self.storage_path / f"{session_id}.json"
-
-        if not session_file.exists():
-            return None
-
-        try:
-            with open(session_file, 'r') as f:
-                session_data = json.load(f)
+        session = self._read_session(session_id)
 
-            session = ConversationSession.parse_obj(session_data)
+        if session:
+            self._flush_now()
             self.current_session = session
-            return session
-        except Exception as e:
-            print(f"Error loading session {session_id}: {e}")
-            return None
+
+        return session
 
     def get_or_create_session(
         self, user_id: str, website_url: Optional[str] = None
@@ -60,6 +180,7 @@ class ConversationMemory:
         recent_session = self._find_recent_session(user_id)
 
         if recent_session:
+            self._flush_now()
             self.current_session = recent_session
             return recent_session
 
@@ -72,9 +193,25 @@ class ConversationMemory:
 
         message = ConversationMessage(role=role, content=content, metadata=metadata or {})
 
+        api_messages = self._api_message_list(self.current_session)
         self.current_session.messages.append(message)
+        api_messages.append(self._to_api_message(message))
         self.current_session.updated_at = datetime.now()
-        self._save_session(self.current_session)
+        self._append_message(self.current_session.session_id, message)
+
+        if len(self.current_session.messages) > self.window_size:
+            self._compress_prefix(self.current_session)
+
+        self._mark_dirty()
+
+    def message_count(self, session: Optional[ConversationSession] = None) -> int:
+        """Total number of messages in a session, including archived ones."""
+        session = session or self.current_session
+        if not session:
+            return 0
+
+        archived = self._archived_count(session)
+        return archived + len(session.messages) - (1 if archived else 0)
 
     def add_recommendation(self, recommendation: SEORecommendation):
         """Add an SEO recommendation to the current session."""
@@ -83,7 +220,8 @@ class ConversationMemory:
 
         self.current_session.recommendations.append(recommendation)
         self.current_session.updated_at = datetime.now()
-        self._save_session(self.current_session)
+        self._context_epoch += 1
+        self._log_event({'type': 'recommendation', 'data': recommendation.model_dump()})
 
     def update_recommendation_status(self, recommendation_id: str, status: str):
         """Update the status of an SEO recommendation."""
@@ -93,8 +231,10 @@ class ConversationMemory:
         for rec in self.current_session.recommendations:
             if rec.id == recommendation_id:
                 rec.implementation_status = status
+                self._forget_dump(self.current_session.session_id, 'recommendations', rec)
                 self.current_session.updated_at = datetime.now()
-                self._save_session(self.current_session)
+                self._context_epoch += 1
+                self._log_event({'type': 'recommendation_status', 'id': recommendation_id, 'status': status})
                 break
 
     def add_website_analysis(self, analysis: WebsiteAnalysis):
@@ -104,13 +244,54 @@ class ConversationMemory:
 
         self.current_session.website_analyses.append(analysis)
         self.current_session.updated_at = datetime.now()
-        self._save_session(self.current_session)
+        self._log_event({'type': 'website_analysis', 'data': analysis.model_dump()})
+
+    def update_user_profile(self, **fields: Any):
+        """Update fields of the current session's user profile."""
+        if not self.current_session:
+            raise ValueError("No active session")
+
+        profile = self.current_session.user_profile
+        self.current_session.user_profile = UserProfile.model_validate({**profile.model_dump(), **fields})
+        self._profile_cache.pop(self.current_session.session_id, None)
+        self.current_session.updated_at = datetime.now()
+        self._context_epoch += 1
+        self._mark_dirty()
 
-    def get_conversation_context(self, max_messages: int = 10) -> str:
-        """Get formatted conversation context for Claude."""
+    def record_check_in(self, timestamp: float):
+        """Record when the last proactive check-in was sent."""
+        if not self.current_session:
+            return
+
+        self.current_session.last_checkin_ts = timestamp
+        self._mark_dirty()
+
+    def get_conversation_context(self, max_messages: int = 10, include_messages: bool = True) -> str:
+        """Get formatted conversation context for Claude.
+
+        Pass include_messages=False when the turns are sent separately as
+        structured messages (see get_message_history).
+        """
         if not self.current_session:
             return ""
 
+        # Reuse the last rendering while nothing it shows has changed
+        key = (
+            self.current_session.session_id,
+            self._context_epoch,
+            max_messages,
+            self.message_count() if include_messages else None,
+        )
+        cached = self._context_cache.get(include_messages)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        context = self._render_context(max_messages, include_messages)
+        self._context_cache[include_messages] = (key, context)
+        return context
+
+    def _render_context(self, max_messages: int, include_messages: bool) -> str:
+        """Build the get_conversation_context() text for the current session."""
         recent_messages = self.current_session.messages[-max_messages:]
         context_parts = []
 
@@ -124,26 +305,57 @@ class ConversationMemory:
             context_parts.append(f"SEO Goals: {', '.join(profile.seo_goals)}")
 
         # Add recent conversation
-        context_parts.append("\nRecent conversation:")
-        for msg in recent_messages:
-            role_label = "User" if msg.role == ConversationRole.USER else "Assistant"
-            context_parts.append(f"{role_label}: {msg.content}")
+        if include_messages:
+            context_parts.append("\nRecent conversation:")
+            if recent_messages:
+                context_parts.append("\n".join(
+                    f"{_ROLE_LABELS.get(msg.role, 'Assistant')}: {msg.content}" for msg in recent_messages
+                ))
 
         # Add recent recommendations
         if self.current_session.recommendations:
             context_parts.append("\nRecent recommendations:")
-            for rec in self.current_session.recommendations[-3:]:
-                status_emoji = {
-                    "pending": "⏳",
-                    "in_progress": "🔄",
-                    "completed": "✅",
-                    "dismissed": "❌",
-                }
-                emoji = status_emoji.get(rec.implementation_status, "")
-                context_parts.append(f"{emoji} {rec.title} ({rec.priority} priority)")
+            context_parts.append("\n".join(
+                f"{_STATUS_EMOJI.get(rec.implementation_status, '')} {rec.title} ({rec.priority} priority)"
+                for rec in self.current_session.recommendations[-3:]
+            ))
 
         return "\n".join(context_parts)
 
+    def get_message_history(self, max_messages: int = 20, align: int = 10) -> List[Dict[str, str]]:
+        """Get recent turns as Claude API messages ({"role", "content"} dicts).
+
+        The start of the history only moves forward in steps of ``align``
+        messages, so the same prefix is resent for several turns in a row and
+        stays eligible for Anthropic prompt caching. The returned dicts are
+        shared with the memory's cache and must not be modified.
+        """
+        if not self.current_session:
+            return []
+
+        session = self.current_session
+        total = self.message_count(session)
+        archived = self._archived_count(session)
+
+        # Absolute index of the first message, rounded down to a multiple of align
+        start = max(0, total - max_messages)
+        start -= start % align
+
+        # Map to an index into the in-memory list (which may begin with a summary)
+        offset = 1 if archived else 0
+        start = max(offset, start - archived + offset)
+
+        history = []
+        for api_message in self._api_message_list(session)[start:]:
+            if api_message is None:
+                continue
+            if not history and api_message["role"] != ConversationRole.USER.value:
+                # The API expects the conversation to open with a user turn
+                continue
+            history.append(api_message)
+
+        return history
+
     def get_user_summary(self) -> str:
         """Get a summary of the user's SEO journey."""
         if not self.current_session:
@@ -152,78 +364,579 @@ class ConversationMemory:
         profile = self.current_session.user_profile
         total_messages = len(self.current_session.messages)
         total_recommendations = len(self.current_session.recommendations)
-        completed_recommendations = len(
-            [
-                r
-                for r in self.current_session.recommendations
-                if r.implementation_status == "completed"
-            ]
+        completed_recommendations = sum(
+            1 for r in self.current_session.recommendations if r.implementation_status == "completed"
         )
 
-        summary = f"""
-User Profile Summary:
+        return f"""User Profile Summary:
 - Website: {profile.website_url or 'Not provided'}
 - Industry: {profile.industry or 'Not specified'}
 - Total conversations: {total_messages // 2}
 - Recommendations given: {total_recommendations}
 - Recommendations completed: {completed_recommendations}
-- Account age: {(datetime.now() - profile.created_at).days} days
-"""
-        return summary.strip()
+- Account age: {(datetime.now() - profile.created_at).days} days"""
 
-    def cleanup_old_sessions(self):
+    async def cleanup_old_sessions(self):
         """Remove sessions older than retention period."""
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-
-        for session_file in self.storage_path.glob("*.json"):
-            try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
+        # Compare file mtimes rather than parsing every session file
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+
+        # The directory scan and deletes run in a worker thread; the index and
+        # caches are only touched back on the event loop
+        removed = await asyncio.to_thread(self._remove_expired_files, cutoff)
+
+        for session_id in removed:
+            self._drop_from_user_index(session_id)
+            self.invalidate(session_id)
+            print(f"Cleaned up old session: {session_id}.json")
+
+    def _remove_expired_files(self, cutoff: float) -> List[str]:
+        """Delete the files of sessions last saved before cutoff (blocking)."""
+        removed = []
+
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('_') or not entry.name.endswith('.json'):
+                    continue
+
+                session_id = entry.name[:-len('.json')]
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        self._messages_file(session_id).unlink(missing_ok=True)
+                        self._events_file(session_id).unlink(missing_ok=True)
+                        self._sealed_events_file(session_id).unlink(missing_ok=True)
+                        removed.append(session_id)
+
+                except Exception as e:
+                    print(f"Error processing {entry.path}: {e}")
+
+        return removed
+
+    def invalidate(self, session_id: str):
+        """Drop a session from the in-memory caches."""
+        self._session_cache.pop(session_id, None)
+        self._profile_cache.pop(session_id, None)
+        self._dump_cache.pop(session_id, None)
+        self._context_epoch += 1
+
+    async def flush(self):
+        """Persist any pending changes immediately (call on shutdown)."""
+        if self._pending_events:
+            # Compact the event log into the snapshot
+            self._dirty = True
+
+        if self._flush_task and not self._flush_task.done():
+            # Wake the pending flush instead of cancelling it mid-write
+            self._flush_wakeup.set()
+            await self._flush_task
+        else:
+            await self._flush_async()
+        self._flush_task = None
+
+        await _write_batcher.wait_appends()
+
+    def _mark_dirty(self):
+        """Record a mutation of the current session and schedule a save."""
+        self._dirty = True
+        self._pending_mutations += 1
+
+        if self._pending_mutations >= self.flush_every:
+            self._flush_now()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Start a delayed flush unless one is already pending."""
+        if self._flush_task and not self._flush_task.done():
+            return
 
-                created_at = datetime.fromisoformat(
-                    session_data['created_at'].replace('Z', '+00:00')
-                )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync callers): nothing to debounce against
+            self._flush_now()
+            return
 
-                if created_at < cutoff_date:
-                    session_file.unlink()
-                    print(f"Cleaned up old session: {session_file.name}")
+        self._flush_wakeup = asyncio.Event()
+        self._flush_task = loop.create_task(self._delayed_flush(self._flush_wakeup))
 
-            except Exception as e:
-                print(f"Error processing {session_file}: {e}")
+    async def _delayed_flush(self, wakeup: asyncio.Event):
+        """Wait for the flush interval (or an explicit flush), then save the session."""
+        try:
+            await asyncio.wait_for(wakeup.wait(), self.flush_interval_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # Cancelled at loop shutdown: save synchronously so no writes are lost
+            self._flush_now()
+            raise
+
+        # Mutations made while a write is in flight are picked up by the next pass
+        while self._dirty:
+            await self._flush_async()
+
+    async def _flush_async(self):
+        """Save the current session off the event loop if it has unsaved changes."""
+        session = self.current_session if self._dirty else None
+        self._dirty = False
+        self._pending_mutations = 0
+        if session:
+            await self._save_session_async(session)
+
+    def _flush_now(self):
+        """Save the current session if it has unsaved changes."""
+        if self._dirty and self.current_session:
+            self._save_session(self.current_session)
+        self._dirty = False
+        self._pending_mutations = 0
 
     def _save_session(self, session: ConversationSession):
-        """Save session to disk."""
-        session_file = self.storage_path / f"{session.session_id}.json"
+        """Save session metadata to disk (messages live in the append-only log)."""
+        payload = self._serialize_session(session)
+        generation = self._seal_event_log(session.session_id)
+        try:
+            self._blocking_write(self._session_file(session.session_id), payload)
+        except Exception as e:
+            print(f"Error saving session: {e}")
+            return
 
+        self._drop_sealed_events(session.session_id, generation)
+        self._record_saved(session)
+        self._save_user_index()
+
+    async def _save_session_async(self, session: ConversationSession):
+        """Like _save_session, but the file writes are batched in a worker thread."""
+        # Serialize on the loop thread; only the raw I/O is offloaded
+        payload = self._serialize_session(session)
+        generation = self._seal_event_log(session.session_id)
         try:
-            with open(session_file, 'w') as f:
-                json.dump(session.dict(), f, indent=2, default=str)
+            await _write_batcher.write(self._session_file(session.session_id), payload)
         except Exception as e:
             print(f"Error saving session: {e}")
+            return
 
-    def _find_recent_session(self, user_id: str) -> Optional[ConversationSession]:
-        """Find the most recent session for a user."""
-        recent_session = None
-        recent_time = None
+        self._drop_sealed_events(session.session_id, generation)
+        self._record_saved(session)
+        try:
+            await _write_batcher.write(self._index_path, json_utils.dumps(self._user_index))
+        except Exception as e:
+            print(f"Error saving user index: {e}")
+
+    def _serialize_session(self, session: ConversationSession) -> bytes:
+        """Serialize session metadata (without messages) to JSON bytes."""
+        profile = self._profile_cache.get(session.session_id)
+        if profile is None:
+            profile = session.user_profile.model_dump()
+            self._profile_cache[session.session_id] = profile
+
+        data = session.model_dump(exclude={'messages', 'user_profile', *_SNAPSHOT_LIST_FIELDS})
+        data['user_profile'] = profile
+        for field in _SNAPSHOT_LIST_FIELDS:
+            data[field] = self._dump_list_field(session, field)
+        return json_utils.dumps(data, indent=self.pretty_json)
+
+    def _dump_list_field(self, session: ConversationSession, field: str) -> List[Dict[str, Any]]:
+        """Dump a snapshot list field, reusing cached dumps of unchanged items."""
+        cache = self._dump_cache.setdefault(session.session_id, {})
+        cached = cache.get(field, [])
+
+        entries = []
+        for i, item in enumerate(getattr(session, field)):
+            if i < len(cached) and cached[i][0] is item:
+                entries.append(cached[i])
+            else:
+                entries.append((item, item.model_dump()))
+
+        cache[field] = entries
+        return [dump for _, dump in entries]
+
+    def _forget_dump(self, session_id: str, field: str, item: Any):
+        """Mark an item mutated in place so its next save re-dumps it."""
+        entries = self._dump_cache.get(session_id, {}).get(field, [])
+        for i, (cached_item, _) in enumerate(entries):
+            if cached_item is item:
+                entries[i] = (None, {})
+                break
+
+    def _record_saved(self, session: ConversationSession):
+        """Update the cache and user index after a session was written."""
+        self._cache_session(session)
+        self._user_index[session.user_profile.user_id] = (
+            session.session_id,
+            session.updated_at.isoformat(),
+        )
 
+    @staticmethod
+    def _blocking_write(path: Path, payload: bytes):
+        """Atomically write bytes to a file now (blocking).
+
+        Goes through the shared batcher so a batched save of an older snapshot
+        that is still in flight can't land after it.
+        """
+        _write_batcher.write_now(path, payload)
+
+    def _session_file(self, session_id: str) -> Path:
+        """Path of a session's metadata file."""
+        return self.storage_path / f"{session_id}.json"
+
+    def _iter_session_files(self) -> Iterator[Path]:
+        """Yield session snapshot files, skipping internal files like the user index."""
         for session_file in self.storage_path.glob("*.json"):
+            if not session_file.name.startswith('_'):
+                yield session_file
+
+    def _read_session(self, session_id: str) -> Optional[ConversationSession]:
+        """Read a session from disk without making it the current session."""
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            self._session_cache.move_to_end(session_id)
+            return cached
+
+        session_file = self._session_file(session_id)
+
+        if not session_file.exists():
+            return None
+
+        try:
+            # Parse and validate straight from bytes (pydantic-core's JSON parser)
+            session = self._session_from_snapshot(
+                ConversationSession.model_validate_json(session_file.read_bytes())
+            )
+        except Exception as e:
+            print(f"Error loading session {session_id}: {e}")
+            return None
+
+        self._cache_session(session)
+        return session
+
+    def _cache_session(self, session: ConversationSession):
+        """Insert or refresh a session in the LRU cache, evicting the oldest."""
+        self._session_cache[session.session_id] = session
+        self._session_cache.move_to_end(session.session_id)
+
+        while len(self._session_cache) > self._cache_max:
+            evicted_id, _ = self._session_cache.popitem(last=False)
+            self._profile_cache.pop(evicted_id, None)
+            self._dump_cache.pop(evicted_id, None)
+
+    def _messages_file(self, session_id: str) -> Path:
+        """Path of the append-only message log for a session."""
+        return self.storage_path / f"{session_id}.messages.jsonl"
+
+    def _append_message(self, session_id: str, message: ConversationMessage):
+        """Append a single message to the session's JSONL log."""
+        self._append_line(self._messages_file(session_id), message.model_dump_json().encode('utf-8'))
+
+    def _append_line(self, path: Path, line: bytes, on_error: Optional[Callable[[], None]] = None):
+        """Queue a line for a log file; the write batcher appends it off the event loop."""
+        _write_batcher.append(path, line + b"\n", on_error)
+
+    def _events_file(self, session_id: str) -> Path:
+        """Path of the log of session changes not yet folded into the snapshot."""
+        return self.storage_path / f"{session_id}.events.jsonl"
+
+    def _sealed_events_file(self, session_id: str) -> Path:
+        """Path of event log entries covered by a snapshot that is being written."""
+        return self.storage_path / f"{session_id}.events.sealed.jsonl"
+
+    def _log_event(self, event: Dict[str, Any]):
+        """Append a change of the current session to its event log."""
+        session = self.current_session
+        event['at'] = session.updated_at
+
+        # If the line can't be written, a snapshot save picks the change up instead
+        self._append_line(self._events_file(session.session_id), json_utils.dumps(event),
+                          on_error=self._mark_dirty)
+
+        self._pending_events += 1
+        if self._pending_events >= self.compact_every:
+            self._mark_dirty()
+
+    def _seal_event_log(self, session_id: str) -> int:
+        """Move the event log aside before writing a snapshot that includes its events.
+
+        Returns a generation number for _drop_sealed_events. Until the snapshot
+        is on disk the sealed events are still replayed on load.
+        """
+        events_file = self._events_file(session_id)
+        sealed_file = self._sealed_events_file(session_id)
+        self._pending_events = 0
+        generation = self._seal_generations.get(session_id, 0) + 1
+        self._seal_generations[session_id] = generation
+
+        # Events still queued land in the new log; the snapshot has them too,
+        # and replaying them is harmless
+        with _write_batcher.log_lock:
+            self._seal_log_files(events_file, sealed_file)
+
+        return generation
+
+    @staticmethod
+    def _seal_log_files(events_file: Path, sealed_file: Path):
+        """Move the event log's contents into the sealed log (blocking)."""
+        if events_file.exists():
             try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
+                if sealed_file.exists():
+                    # An earlier snapshot isn't confirmed on disk yet: keep its events too
+                    with open(sealed_file, 'ab') as f:
+                        f.write(events_file.read_bytes())
+                    events_file.unlink()
+                else:
+                    events_file.replace(sealed_file)
+            except OSError as e:
+                print(f"Error sealing event log: {e}")
 
-                if session_data['user_profile']['user_id'] == user_id:
-                    updated_at = datetime.fromisoformat(
-                        session_data['updated_at'].replace('Z', '+00:00')
-                    )
+    def _drop_sealed_events(self, session_id: str, generation: int):
+        """Delete sealed events once the snapshot containing them is written."""
+        if self._seal_generations.get(session_id) == generation:
+            self._sealed_events_file(session_id).unlink(missing_ok=True)
+
+    def _replay_events(self, session: ConversationSession):
+        """Apply logged changes newer than the session's snapshot.
+
+        Events are idempotent, so ones the snapshot already contains are harmless.
+        """
+        for events_file in (self._sealed_events_file(session.session_id),
+                            self._events_file(session.session_id)):
+            if not events_file.exists():
+                continue
+
+            with open(events_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply_event(session, json_utils.loads(line))
+                    except Exception as e:
+                        print(f"Error replaying event for session {session.session_id}: {e}")
+
+    @staticmethod
+    def _apply_event(session: ConversationSession, event: Dict[str, Any]):
+        """Apply one event log entry to a session."""
+        kind = event['type']
+
+        if kind == 'recommendation':
+            recommendation = SEORecommendation.model_validate(event['data'])
+            for i, existing in enumerate(session.recommendations):
+                if existing.id == recommendation.id:
+                    session.recommendations[i] = recommendation
+                    break
+            else:
+                session.recommendations.append(recommendation)
+
+        elif kind == 'recommendation_status':
+            for rec in session.recommendations:
+                if rec.id == event['id']:
+                    rec.implementation_status = event['status']
+                    break
+
+        elif kind == 'website_analysis':
+            analysis = WebsiteAnalysis.model_validate(event['data'])
+            if not any(
+                a.url == analysis.url and a.analyzed_at == analysis.analyzed_at
+                for a in session.website_analyses
+            ):
+                session.website_analyses.append(analysis)
+
+        at = _parse_iso(event['at'])
+        if at > session.updated_at:
+            session.updated_at = at
+
+    def _compress_prefix(self, session: ConversationSession):
+        """Drop the oldest in-memory messages, folding them into a summary message.
+
+        The dropped messages are already in the session's message log, so only
+        the in-memory list shrinks.
+        """
+        archived = self._archived_count(session)
+        start = 1 if archived else 0
+        dropped = session.messages[start:start + self.compress_batch]
+
+        if self._api_messages_session is session:
+            self._api_messages[:start + len(dropped)] = [None]
+
+        session.messages[:start + len(dropped)] = [
+            self._summary_message(archived + len(dropped), dropped[-1].timestamp)
+        ]
+
+    def _api_message_list(self, session: ConversationSession) -> List[Optional[Dict[str, str]]]:
+        """Return the cached API-format messages for a session, rebuilding them if stale."""
+        if (self._api_messages_session is not session
+                or len(self._api_messages) != len(session.messages)):
+            self._api_messages = [self._to_api_message(msg) for msg in session.messages]
+            self._api_messages_session = session
+        return self._api_messages
+
+    @staticmethod
+    def _to_api_message(message: ConversationMessage) -> Optional[Dict[str, str]]:
+        """Convert a message to a Claude API message; system messages have no API form."""
+        if message.role == ConversationRole.SYSTEM:
+            return None
+        return {"role": message.role.value, "content": message.content}
+
+    @staticmethod
+    def _archived_count(session: ConversationSession) -> int:
+        """Number of messages folded into the session's leading summary message."""
+        if session.messages:
+            return session.messages[0].metadata.get('archived_messages', 0)
+        return 0
+
+    @staticmethod
+    def _summary_message(archived: int, until: datetime) -> ConversationMessage:
+        """Placeholder standing in for messages that were moved out of memory."""
+        return ConversationMessage(
+            role=ConversationRole.SYSTEM,
+            content=f"[{archived} earlier messages archived]",
+            timestamp=until,
+            metadata={'archived_messages': archived},
+        )
 
-                    if recent_time is None or updated_at > recent_time:
-                        recent_time = updated_at
-                        recent_session = ConversationSession.parse_obj(session_data)
+    def _iter_logged_messages(self, session_id: str) -> Iterator[ConversationMessage]:
+        """Stream messages back from the session's JSONL log."""
+        for line in self._iter_logged_lines(session_id):
+            yield ConversationMessage.model_validate_json(line)
+
+    def _iter_logged_lines(self, session_id: str) -> Iterator[bytes]:
+        """Stream the raw JSON lines of the session's message log."""
+        _write_batcher.append_now()  # Include queued messages (may run in a worker thread)
+        messages_file = self._messages_file(session_id)
+
+        if not messages_file.exists():
+            return
+
+        with open(messages_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield line
+
+    def _session_from_snapshot(self, session: ConversationSession) -> ConversationSession:
+        """Attach the message log to a session loaded from its metadata file."""
+        _write_batcher.append_now()  # Logs must be complete on disk
+        if session.messages and not self._messages_file(session.session_id).exists():
+            # Legacy snapshot with inline messages: move them into the log
+            for message in session.messages:
+                self._append_message(session.session_id, message)
+            session.messages = self._window_with_summary(session.messages, len(session.messages))
+        else:
+            session.messages = self._load_message_window(session.session_id)
+
+        self._replay_events(session)
+        return session
+
+    def _load_message_window(self, session_id: str) -> List[ConversationMessage]:
+        """Load the last window_size messages from the log, summarizing the rest."""
+        total = 0
+        window = deque(maxlen=self.window_size)
+        for line in self._iter_logged_lines(session_id):
+            window.append(line)
+            total += 1
+
+        # Only the kept lines are validated, as one JSON array
+        messages = _MESSAGE_LIST.validate_json(b'[' + b','.join(window) + b']')
+        return self._window_with_summary(messages, total)
+
+    def _window_with_summary(
+        self, messages: List[ConversationMessage], total: int
+    ) -> List[ConversationMessage]:
+        """Keep the last window_size messages, prefixed by a summary if any were dropped."""
+        messages = messages[-self.window_size:]
+        archived = total - len(messages)
+        if archived <= 0:
+            return messages
+
+        return [self._summary_message(archived, messages[0].timestamp)] + messages
+
+    def _find_recent_session(self, user_id: str) -> Optional[ConversationSession]:
+        """Find the most recent session for a user."""
+        entry = self._user_index.get(user_id)
+
+        if not entry:
+            return None
+
+        session = self._read_session(entry[0])
+
+        if session is None:
+            # Index points at a session that no longer exists on disk
+            self._drop_from_user_index(entry[0])
+
+        return session
+
+    def _load_user_index(self):
+        """Load the user index, rebuilding it from session files if missing."""
+        if not self._index_path.exists():
+            self._rebuild_user_index()
+            return
+
+        try:
+            with open(self._index_path, 'rb') as f:
+                self._user_index = {
+                    user_id: tuple(entry) for user_id, entry in json_utils.loads(f.read()).items()
+                }
+        except Exception as e:
+            print(f"Error loading user index: {e}")
+            self._rebuild_user_index()
+
+    def _rebuild_user_index(self):
+        """Scan every session file once to rebuild the user index."""
+        self._user_index = {}
+        latest: Dict[str, datetime] = {}
+
+        for session_file in self._iter_session_files():
+            try:
+                session_id, user_id, updated_at_str = self._read_index_fields(session_file)
+                updated_at = _parse_iso(updated_at_str)
+
+                if user_id not in latest or updated_at > latest[user_id]:
+                    latest[user_id] = updated_at
+                    self._user_index[user_id] = (session_id, updated_at_str)
 
             except Exception as e:
                 print(f"Error processing {session_file}: {e}")
 
-        return recent_session
+        self._save_user_index()
+
+    @staticmethod
+    def _read_index_fields(session_file: Path) -> Tuple[str, str, str]:
+        """Read (session_id, user_id, updated_at) from a snapshot without parsing all of it.
+
+        The file is memory-mapped and the three fields are matched in place;
+        legacy snapshots (or ones missing a field) fall back to a full parse.
+        """
+        with open(session_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not _INLINE_MESSAGES_RE.search(mm):
+                matches = [pattern.search(mm) for pattern in (_SESSION_ID_RE, _USER_ID_RE, _UPDATED_AT_RE)]
+                if all(matches):
+                    # Decode as JSON strings to resolve any escapes
+                    session_id, user_id, updated_at = (
+                        json_utils.loads(b'"' + match.group(1) + b'"') for match in matches
+                    )
+                    return session_id, user_id, updated_at
+
+            session_data = json_utils.loads(mm[:])
+
+        return (
+            session_data['session_id'],
+            session_data['user_profile']['user_id'],
+            session_data['updated_at'],
+        )
+
+    def _drop_from_user_index(self, session_id: str):
+        """Remove index entries pointing at a deleted session."""
+        stale = [user_id for user_id, entry in self._user_index.items() if entry[0] == session_id]
+
+        for user_id in stale:
+            del self._user_index[user_id]
+
+        if stale:
+            self._save_user_index()
+
+    def _save_user_index(self):
+        """Persist the user index to disk."""
+        try:
+            self._blocking_write(self._index_path, json_utils.dumps(self._user_index))
+        except Exception as e:
+            print(f"Error saving user index: {e}")
 
     def export_to_markdown(
         self, output_path: Optional[str] = None, include_conversation: bool = False
@@ -240,42 +953,76 @@ User Profile Summary:
         if not self.current_session:
             raise ValueError("No active session to export")
 
-        session = self.current_session
-        profile = session.user_profile
+        markdown_content = "\n".join(
+            self._iter_markdown_lines(self.current_session, include_conversation)
+        )
+
+        # Save to file if path provided
+        if output_path:
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(markdown_content)
+
+        return markdown_content
+
+    def write_markdown_report(self, output_path: str, include_conversation: bool = False) -> Path:
+        """Like export_to_markdown, but stream the report to a file line by line.
+
+        The report is never held in memory as a whole, which matters for long
+        conversations. Returns the path of the written file.
+        """
+        if not self.current_session:
+            raise ValueError("No active session to export")
 
-        # Build markdown content
-        lines = []
+        lines = self._iter_markdown_lines(self.current_session, include_conversation)
+
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(next(lines))
+            for line in lines:
+                f.write("\n")
+                f.write(line)
+
+        return output_file
+
+    def _iter_markdown_lines(
+        self, session: ConversationSession, include_conversation: bool
+    ) -> Iterator[str]:
+        """Yield the lines of a session's markdown report."""
+        profile = session.user_profile
 
         # Header
-        lines.append("# SEO Consultation Report")
-        lines.append("")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Session ID:** `{session.session_id}`")
-        lines.append("")
+        yield "# SEO Consultation Report"
+        yield ""
+        yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"**Session ID:** `{session.session_id}`"
+        yield ""
 
         # User Profile
-        lines.append("## 👤 Client Profile")
-        lines.append("")
+        yield "## 👤 Client Profile"
+        yield ""
         if profile.website_url:
-            lines.append(f"**Website:** {profile.website_url}")
+            yield f"**Website:** {profile.website_url}"
         if profile.industry:
-            lines.append(f"**Industry:** {profile.industry}")
+            yield f"**Industry:** {profile.industry}"
         if profile.seo_goals:
-            lines.append(f"**SEO Goals:** {', '.join(profile.seo_goals)}")
+            yield f"**SEO Goals:** {', '.join(profile.seo_goals)}"
         if profile.current_challenges:
-            lines.append(f"**Current Challenges:** {', '.join(profile.current_challenges)}")
-        lines.append("")
+            yield f"**Current Challenges:** {', '.join(profile.current_challenges)}"
+        yield ""
 
         # Website Analyses
         if session.website_analyses:
-            lines.append("## 🔍 Website Analysis")
-            lines.append("")
+            yield "## 🔍 Website Analysis"
+            yield ""
 
             for i, analysis in enumerate(session.website_analyses, 1):
-                lines.append(f"### Analysis #{i}: {analysis.url}")
-                lines.append("")
-                lines.append(f"**Analyzed:** {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M')}")
-                lines.append("")
+                yield f"### Analysis #{i}: {analysis.url}"
+                yield ""
+                yield f"**Analyzed:** {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M')}"
+                yield ""
 
                 # AI Readiness Score with visual indicator
                 score = analysis.ai_readiness_score or 0
@@ -288,164 +1035,152 @@ User Profile Summary:
                 else:
                     score_indicator = "🔴 Critical"
 
-                lines.append(f"**AI Readiness Score:** {score}/100 {score_indicator}")
-                lines.append("")
+                yield f"**AI Readiness Score:** {score}/100 {score_indicator}"
+                yield ""
 
                 # Page Metadata
-                lines.append("#### 📄 Page Metadata")
-                lines.append("")
+                yield "#### 📄 Page Metadata"
+                yield ""
                 if analysis.title:
-                    lines.append(f"**Title:** {analysis.title}")
+                    yield f"**Title:** {analysis.title}"
                 else:
-                    lines.append("**Title:** ❌ Missing")
+                    yield "**Title:** ❌ Missing"
 
                 if analysis.meta_description:
-                    lines.append(f"**Meta Description:** {analysis.meta_description}")
+                    yield f"**Meta Description:** {analysis.meta_description}"
                 else:
-                    lines.append("**Meta Description:** ❌ Missing")
-                lines.append("")
+                    yield "**Meta Description:** ❌ Missing"
+                yield ""
 
                 # Content Structure
-                lines.append("#### 📐 Content Structure")
-                lines.append("")
+                yield "#### 📐 Content Structure"
+                yield ""
                 if analysis.h1_tags:
-                    lines.append(f"**H1 Tags ({len(analysis.h1_tags)}):**")
+                    yield f"**H1 Tags ({len(analysis.h1_tags)}):**"
                     for h1 in analysis.h1_tags[:5]:  # Show max 5
-                        lines.append(f"- {h1}")
+                        yield f"- {h1}"
                     if len(analysis.h1_tags) > 5:
-                        lines.append(f"- *...and {len(analysis.h1_tags) - 5} more*")
+                        yield f"- *...and {len(analysis.h1_tags) - 5} more*"
                 else:
-                    lines.append("**H1 Tags:** ❌ None found")
-                lines.append("")
+                    yield "**H1 Tags:** ❌ None found"
+                yield ""
 
                 if analysis.content_quality_score is not None:
-                    lines.append(f"**Content Quality Score:** {analysis.content_quality_score}/100")
-                    lines.append("")
+                    yield f"**Content Quality Score:** {analysis.content_quality_score}/100"
+                    yield ""
 
                 # Technical Issues
                 if analysis.technical_issues:
-                    lines.append("#### 🚨 Technical Issues")
-                    lines.append("")
+                    yield "#### 🚨 Technical Issues"
+                    yield ""
                     for issue in analysis.technical_issues:
-                        lines.append(f"- ❌ {issue}")
-                    lines.append("")
+                        yield f"- ❌ {issue}"
+                    yield ""
 
                 # Content Suggestions
                 if analysis.content_suggestions:
-                    lines.append("#### 💡 Content Optimization Suggestions")
-                    lines.append("")
+                    yield "#### 💡 Content Optimization Suggestions"
+                    yield ""
                     for suggestion in analysis.content_suggestions:
-                        lines.append(f"- 📝 {suggestion}")
-                    lines.append("")
+                        yield f"- 📝 {suggestion}"
+                    yield ""
+
+        # Group recommendations by status in a single pass (dismissed ones are skipped)
+        buckets: Dict[str, List[SEORecommendation]] = {
+            "pending": [],
+            "in_progress": [],
+            "completed": [],
+        }
+        for rec in session.recommendations:
+            bucket = buckets.get(rec.implementation_status)
+            if bucket is not None:
+                bucket.append(rec)
+
+        pending = buckets["pending"]
+        in_progress = buckets["in_progress"]
+        completed = buckets["completed"]
 
         # Recommendations
         if session.recommendations:
-            lines.append("## 📋 SEO Recommendations")
-            lines.append("")
-
-            # Group by status
-            pending = [r for r in session.recommendations if r.implementation_status == "pending"]
-            in_progress = [
-                r for r in session.recommendations if r.implementation_status == "in_progress"
-            ]
-            completed = [
-                r for r in session.recommendations if r.implementation_status == "completed"
-            ]
+            yield "## 📋 SEO Recommendations"
+            yield ""
 
             if pending:
-                lines.append("### 🔴 Pending Recommendations")
-                lines.append("")
+                yield "### 🔴 Pending Recommendations"
+                yield ""
                 for rec in pending:
-                    lines.append(f"#### {rec.title}")
-                    lines.append(
-                        f"**Priority:** {rec.priority.upper()} | **Category:** {rec.category}"
-                    )
-                    lines.append("")
-                    lines.append(rec.description)
-                    lines.append("")
+                    yield f"#### {rec.title}"
+                    yield f"**Priority:** {rec.priority.upper()} | **Category:** {rec.category}"
+                    yield ""
+                    yield rec.description
+                    yield ""
                     if rec.estimated_impact:
-                        lines.append(f"**Estimated Impact:** {rec.estimated_impact}")
-                        lines.append("")
+                        yield f"**Estimated Impact:** {rec.estimated_impact}"
+                        yield ""
 
             if in_progress:
-                lines.append("### 🟡 In Progress")
-                lines.append("")
+                yield "### 🟡 In Progress"
+                yield ""
                 for rec in in_progress:
-                    lines.append(f"#### {rec.title}")
-                    lines.append(
-                        f"**Priority:** {rec.priority.upper()} | **Category:** {rec.category}"
-                    )
-                    lines.append("")
-                    lines.append(rec.description)
-                    lines.append("")
+                    yield f"#### {rec.title}"
+                    yield f"**Priority:** {rec.priority.upper()} | **Category:** {rec.category}"
+                    yield ""
+                    yield rec.description
+                    yield ""
 
             if completed:
-                lines.append("### ✅ Completed")
-                lines.append("")
+                yield "### ✅ Completed"
+                yield ""
                 for rec in completed:
-                    lines.append(f"- {rec.title} ({rec.category})")
-                lines.append("")
+                    yield f"- {rec.title} ({rec.category})"
+                yield ""
 
         # Competitor Analyses
         if session.competitor_analyses:
-            lines.append("## 🏆 Competitive Analysis")
-            lines.append("")
+            yield "## 🏆 Competitive Analysis"
+            yield ""
 
             for analysis in session.competitor_analyses:
-                lines.append(f"### {analysis.your_domain} vs Competitors")
-                lines.append("")
-                lines.append(f"**Analyzed:** {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M')}")
-                lines.append("")
+                yield f"### {analysis.your_domain} vs Competitors"
+                yield ""
+                yield f"**Analyzed:** {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M')}"
+                yield ""
 
                 if analysis.key_insights:
-                    lines.append("**Key Insights:**")
+                    yield "**Key Insights:**"
                     for insight in analysis.key_insights:
-                        lines.append(f"- {insight}")
-                    lines.append("")
+                        yield f"- {insight}"
+                    yield ""
 
                 if analysis.recommendations:
-                    lines.append("**Recommendations:**")
+                    yield "**Recommendations:**"
                     for rec in analysis.recommendations:
-                        lines.append(f"- {rec}")
-                    lines.append("")
+                        yield f"- {rec}"
+                    yield ""
 
         # Conversation History (optional)
         if include_conversation and session.messages:
-            lines.append("## 💬 Conversation History")
-            lines.append("")
+            yield "## 💬 Conversation History"
+            yield ""
 
-            for msg in session.messages:
+            # Read the full history from the log; memory only holds the recent window
+            for msg in self._iter_logged_messages(session.session_id):
                 role_emoji = "👤" if msg.role == ConversationRole.USER else "🤖"
                 role_label = "You" if msg.role == ConversationRole.USER else "Agent"
-                lines.append(
-                    f"### {role_emoji} {role_label} ({msg.timestamp.strftime('%H:%M:%S')})"
-                )
-                lines.append("")
-                lines.append(msg.content)
-                lines.append("")
+                yield f"### {role_emoji} {role_label} ({msg.timestamp.strftime('%H:%M:%S')})"
+                yield ""
+                yield msg.content
+                yield ""
 
         # Summary
-        lines.append("## 📊 Summary")
-        lines.append("")
-        lines.append(f"- **Total Conversations:** {len(session.messages) // 2}")
-        lines.append(f"- **Recommendations Given:** {len(session.recommendations)}")
-        lines.append(
-            f"- **Completed Actions:** {len([r for r in session.recommendations if r.implementation_status == 'completed'])}"
-        )
-        lines.append(f"- **Website Analyses:** {len(session.website_analyses)}")
-        lines.append(f"- **Competitor Analyses:** {len(session.competitor_analyses)}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        lines.append("*Generated by LLM SEO Agent*")
-
-        markdown_content = "\n".join(lines)
-
-        # Save to file if path provided
-        if output_path:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-
-        return markdown_content
+        yield "## 📊 Summary"
+        yield ""
+        yield f"- **Total Conversations:** {self.message_count(session) // 2}"
+        yield f"- **Recommendations Given:** {len(session.recommendations)}"
+        yield f"- **Completed Actions:** {len(completed)}"
+        yield f"- **Website Analyses:** {len(session.website_analyses)}"
+        yield f"- **Competitor Analyses:** {len(session.competitor_analyses)}"
+        yield ""
+        yield "---"
+        yield ""
+        yield "*Generated by LLM SEO Agent*"
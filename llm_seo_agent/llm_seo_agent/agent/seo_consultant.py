@@ -1,114 +1,163 @@
 import uuid
 import asyncio
-from typing import Dict, List, Any, Optional
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from .memory import ConversationMemory
 from .tools import SEOTools
+from llm_seo_agent.utils import json_utils
 from llm_seo_agent.utils.claude_client import ClaudeClient
 from llm_seo_agent.utils.data_models import (
     ConversationRole, SEORecommendation, ToolResponse, WebsiteAnalysis
 )
 
 
-class SEOConsultant:
-    def __init__(self, claude_api_key: Optional[str] = None, storage_path: str = "data/conversations"):
-        self.claude = ClaudeClient(api_key=claude_api_key)
-        self.memory = ConversationMemory(storage_path=storage_path)
-        self.current_user_id = "default_user"  # In production, this would be dynamic
-        self.tool_schemas = self._define_tool_schemas()
+# Static system prompt for the SEO consultant; kept constant so it is cached
+_SYSTEM_PROMPT = """You are an expert SEO consultant specializing in AI search optimization.
+        You help businesses optimize their websites to appear in AI-generated responses from ChatGPT, Claude, Perplexity, and other AI systems.
 
-    def _define_tool_schemas(self) -> List[Dict[str, Any]]:
-        """Define tool schemas for Claude API."""
-        return [
-            {
-                "name": "analyze_website",
-                "description": "Analyzes a website for SEO optimization opportunities. Returns comprehensive SEO metrics including title tags, meta descriptions, heading structure, content analysis, schema markup detection, and AI readiness score. Use this when the user asks to analyze, audit, or check their website.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "The website URL to analyze (e.g., 'https://example.com' or 'example.com')"
-                        }
-                    },
-                    "required": ["url"]
+        Your expertise includes:
+        - Content structure for AI citations
+        - Schema markup and structured data
+        - Authority building and E-A-T optimization
+        - Technical SEO for AI crawlers
+        - Competitive analysis for AI search
+
+        When a user asks about analyzing a website, checking competitors, or tracking performance, use the appropriate tools.
+        When a user asks you to create, write, or save a report to a file, use the write_report_to_file tool.
+        Always provide specific, actionable advice with clear next steps.
+        """
+
+_NEW_USER_WELCOME = (
+    "Welcome! I'm your SEO consultant, specializing in getting websites cited by AI "
+    "search engines like ChatGPT, Claude and Perplexity. Share your website URL and "
+    "I'll analyze it, or ask me anything about optimizing for AI search."
+)
+
+
+# Tool schemas for the Claude API, built once at import
+_TOOL_SCHEMAS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "analyze_website",
+        "description": "Analyzes a website for SEO optimization opportunities. Returns comprehensive SEO metrics including title tags, meta descriptions, heading structure, content analysis, schema markup detection, and AI readiness score. Use this when the user asks to analyze, audit, or check their website.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The website URL to analyze (e.g., 'https://example.com' or 'example.com')"
                 }
             },
-            {
-                "name": "compare_competitors",
-                "description": "Compares your website against competitor websites for SEO metrics. Analyzes AI readiness scores, content depth, schema markup usage, and provides competitive insights. Use this when the user wants to compare their site with competitors.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "your_site": {
-                            "type": "string",
-                            "description": "The user's website URL"
-                        },
-                        "competitor_sites": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of competitor website URLs (up to 3)"
-                        }
-                    },
-                    "required": ["your_site", "competitor_sites"]
+            "required": ["url"]
+        }
+    },
+    {
+        "name": "compare_competitors",
+        "description": "Compares your website against competitor websites for SEO metrics. Analyzes AI readiness scores, content depth, schema markup usage, and provides competitive insights. Use this when the user wants to compare their site with competitors.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "your_site": {
+                    "type": "string",
+                    "description": "The user's website URL"
+                },
+                "competitor_sites": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of competitor website URLs (up to 3)"
                 }
             },
-            {
-                "name": "check_ai_citations",
-                "description": "Checks how often a domain is cited by AI search engines like ChatGPT, Claude, and Perplexity. Provides citation frequency, trending topics, and recommendations for improvement. Use when user asks about AI search visibility or citations.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain to check (e.g., 'example.com')"
-                        },
-                        "keywords": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional list of keywords to analyze"
-                        }
-                    },
-                    "required": ["domain"]
+            "required": ["your_site", "competitor_sites"]
+        }
+    },
+    {
+        "name": "check_ai_citations",
+        "description": "Checks how often a domain is cited by AI search engines like ChatGPT, Claude, and Perplexity. Provides citation frequency, trending topics, and recommendations for improvement. Use when user asks about AI search visibility or citations.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain to check (e.g., 'example.com')"
+                },
+                "keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of keywords to analyze"
                 }
             },
-            {
-                "name": "track_performance",
-                "description": "Tracks SEO performance metrics over time including AI citations, organic traffic, and search rankings. Use when user wants to see performance trends or track progress.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain to track"
-                        },
-                        "timeframe": {
-                            "type": "string",
-                            "description": "Timeframe for analysis (e.g., '30d', '7d', '90d')",
-                            "default": "30d"
-                        }
-                    },
-                    "required": ["domain"]
+            "required": ["domain"]
+        }
+    },
+    {
+        "name": "track_performance",
+        "description": "Tracks SEO performance metrics over time including AI citations, organic traffic, and search rankings. Use when user wants to see performance trends or track progress.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain to track"
+                },
+                "timeframe": {
+                    "type": "string",
+                    "description": "Timeframe for analysis (e.g., '30d', '7d', '90d')",
+                    "default": "30d"
                 }
             },
-            {
-                "name": "write_report_to_file",
-                "description": "Writes a comprehensive SEO analysis report to a markdown file. Use this after analyzing a website to save a detailed, well-formatted report that the user can share with colleagues or clients. Write the report in a professional, narrative style with all insights, recommendations, and action plans.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "filename": {
-                            "type": "string",
-                            "description": "The output filename (e.g., 'suhas_org_seo_analysis.md'). Use descriptive names based on the website analyzed."
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "The full markdown content of the report. Include executive summary, detailed findings, AI readiness score, technical issues, content suggestions, recommendations with priorities, and action plan."
-                        }
-                    },
-                    "required": ["filename", "content"]
+            "required": ["domain"]
+        }
+    },
+    {
+        "name": "write_report_to_file",
+        "description": "Writes a comprehensive SEO analysis report to a markdown file. Use this after analyzing a website to save a detailed, well-formatted report that the user can share with colleagues or clients. Write the report in a professional, narrative style with all insights, recommendations, and action plans.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The output filename (e.g., 'suhas_org_seo_analysis.md'). Use descriptive names based on the website analyzed."
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The full markdown content of the report. Include executive summary, detailed findings, AI readiness score, technical issues, content suggestions, recommendations with priorities, and action plan."
                 }
-            }
-        ]
+            },
+            "required": ["filename", "content"]
+        }
+    }
+)
+
+# Tool name -> call on an open SEOTools instance, mapping the tool_use input to arguments
+_TOOL_DISPATCH: Dict[str, Callable[[SEOTools, Dict[str, Any]], Awaitable[ToolResponse]]] = {
+    "analyze_website": lambda tools, i: tools.analyze_website(i["url"]),
+    "compare_competitors": lambda tools, i: tools.compare_competitors(
+        i["your_site"], i["competitor_sites"]
+    ),
+    "check_ai_citations": lambda tools, i: tools.check_ai_citations(
+        i["domain"], i.get("keywords", [])
+    ),
+    "track_performance": lambda tools, i: tools.track_performance(
+        i["domain"], i.get("timeframe", "30d")
+    ),
+    "write_report_to_file": lambda tools, i: tools.write_report_to_file(
+        i["filename"], i["content"]
+    ),
+}
+
+
+# Minimum time between proactive check-ins, in seconds
+_CHECK_IN_INTERVAL = 7 * 86400
+
+# Reply used when Claude's response has no text to show
+_NO_RESPONSE = "I apologize, but I couldn't generate a proper response."
+
+
+class SEOConsultant:
+    def __init__(self, claude_api_key: Optional[str] = None, storage_path: str = "data/conversations"):
+        self.claude = ClaudeClient(api_key=claude_api_key)
+        self.memory = ConversationMemory(storage_path=storage_path)
+        self.current_user_id = "default_user"  # In production, this would be dynamic
+        self.tool_schemas = _TOOL_SCHEMAS
 
     async def start_conversation(self, user_id: str = None, website_url: str = None) -> str:
         """Start a new conversation or continue existing one."""
@@ -118,20 +167,25 @@ class SEOConsultant:
         # Get or create session
         session = self.memory.get_or_create_session(self.current_user_id, website_url)
 
-        # Generate welcome message
+        # Generate welcome message (short canned-style replies go to the fast model)
         welcome_context = self.memory.get_user_summary()
 
-        if len(session.messages) == 0:
+        if self._is_simple_welcome(session):
+            # Brand-new user we know nothing about: nothing to personalize
+            welcome_message = _NEW_USER_WELCOME
+        elif len(session.messages) == 0:
             # First time user
             welcome_message = await self.claude.casual_conversation(
                 user_message="Generate a warm welcome message for a new SEO consultation client",
-                context=welcome_context
+                context=welcome_context,
+                model=self.claude.fast_model
             )
         else:
             # Returning user
             welcome_message = await self.claude.casual_conversation(
                 user_message="Generate a welcome back message for a returning SEO client",
-                context=welcome_context
+                context=welcome_context,
+                model=self.claude.fast_model
             )
 
         # Add welcome to memory
@@ -142,27 +196,15 @@ class SEOConsultant:
     async def chat(self, user_message: str) -> str:
         """Process a user message and generate response with tool calling."""
 
+        # Prior turns go out as structured messages (a cacheable prefix); only the
+        # profile/recommendation context rides along with the new message
+        history = self.memory.get_message_history()
+        context = self.memory.get_conversation_context(include_messages=False)
+
         # Add user message to memory
         self.memory.add_message(ConversationRole.USER, user_message)
 
-        # Get conversation context
-        context = self.memory.get_conversation_context()
-
-        # System prompt for SEO consultant
-        system_prompt = """You are an expert SEO consultant specializing in AI search optimization.
-        You help businesses optimize their websites to appear in AI-generated responses from ChatGPT, Claude, Perplexity, and other AI systems.
-
-        Your expertise includes:
-        - Content structure for AI citations
-        - Schema markup and structured data
-        - Authority building and E-A-T optimization
-        - Technical SEO for AI crawlers
-        - Competitive analysis for AI search
-
-        When a user asks about analyzing a website, checking competitors, or tracking performance, use the appropriate tools.
-        When a user asks you to create, write, or save a report to a file, use the write_report_to_file tool.
-        Always provide specific, actionable advice with clear next steps.
-        """
+        system_prompt = _SYSTEM_PROMPT
 
         try:
             # Call Claude with tools available
@@ -170,13 +212,16 @@ class SEOConsultant:
                 user_message=user_message,
                 context=context,
                 system_prompt=system_prompt,
-                tools=self.tool_schemas
+                tools=self.tool_schemas,
+                history=history
             )
 
             # Check if Claude wants to use tools
             if response.stop_reason == "tool_use":
                 # Execute tools and get results
-                final_response = await self._execute_tools_and_respond(response, user_message, context, system_prompt)
+                final_response = await self._execute_tools_and_respond(
+                    response, user_message, context, system_prompt, history
+                )
             else:
                 # No tools needed, extract text response
                 final_response = self._extract_text_from_response(response)
@@ -191,6 +236,72 @@ class SEOConsultant:
             self.memory.add_message(ConversationRole.ASSISTANT, error_response)
             return error_response
 
+    async def chat_stream(self, user_message: str) -> AsyncIterator[str]:
+        """Like chat(), but yields the response text as it is generated.
+
+        The first call still waits for Claude to decide on tools; when tools
+        are used, the (slower) follow-up answer is streamed token by token.
+        """
+        history = self.memory.get_message_history()
+        context = self.memory.get_conversation_context(include_messages=False)
+
+        self.memory.add_message(ConversationRole.USER, user_message)
+
+        parts: List[str] = []
+        try:
+            response = await self.claude.generate_response_with_tools(
+                user_message=user_message,
+                context=context,
+                system_prompt=_SYSTEM_PROMPT,
+                tools=self.tool_schemas,
+                history=history
+            )
+
+            tool_use_blocks = [block for block in response.content
+                               if getattr(block, 'type', None) == "tool_use"]
+
+            if response.stop_reason == "tool_use" and tool_use_blocks:
+                tool_results = await self._run_requested_tools(tool_use_blocks)
+                messages = self._tool_followup_messages(
+                    response, tool_results, user_message, context, history
+                )
+
+                async with self.claude.async_client.messages.stream(
+                    model=self.claude.model,
+                    max_tokens=4000,
+                    system=self.claude.cached_system(_SYSTEM_PROMPT),
+                    messages=messages,
+                    tools=self.tool_schemas
+                ) as stream:
+                    async for text in stream.text_stream:
+                        parts.append(text)
+                        yield text
+
+                    if not parts:
+                        # The follow-up can end in another tool call with no text
+                        text = self._extract_text_from_response(await stream.get_final_message())
+                        parts.append(text)
+                        yield text
+            else:
+                text = self._extract_text_from_response(response)
+                parts.append(text)
+                yield text
+
+        except Exception as e:
+            error_response = f"I encountered an error: {str(e)}. Let me try to help you differently."
+            if parts:
+                # Keep the partial answer the user already saw
+                error_response = "\n\n" + error_response
+            parts.append(error_response)
+            yield error_response
+
+        if not "".join(parts).strip():
+            # Never store an empty turn: the API rejects it in later histories
+            parts.append(_NO_RESPONSE)
+            yield _NO_RESPONSE
+
+        self.memory.add_message(ConversationRole.ASSISTANT, "".join(parts))
+
     def _extract_text_from_response(self, response) -> str:
         """Extract text from Claude response object."""
         for content_block in response.content:
@@ -198,9 +309,11 @@ class SEOConsultant:
                 return content_block.text
             elif isinstance(content_block, dict) and 'text' in content_block:
                 return content_block['text']
-        return "I apologize, but I couldn't generate a proper response."
+        return _NO_RESPONSE
 
-    async def _execute_tools_and_respond(self, initial_response, user_message: str, context: str, system_prompt: str) -> str:
+    async def _execute_tools_and_respond(self, initial_response, user_message: str, context: str,
+                                         system_prompt: str,
+                                         history: Optional[List[Dict[str, str]]] = None) -> str:
         """Execute tools requested by Claude and generate final response."""
 
         # Extract tool use requests from response
@@ -210,102 +323,102 @@ class SEOConsultant:
         if not tool_use_blocks:
             return self._extract_text_from_response(initial_response)
 
-        # Execute each tool
-        tool_results = []
-        async with SEOTools() as tools:
-            for tool_use in tool_use_blocks:
-                tool_name = tool_use.name
-                tool_input = tool_use.input
-                tool_use_id = tool_use.id
-
-                # Execute the appropriate tool
-                result = await self._execute_single_tool(tools, tool_name, tool_input)
-
-                # Store result in Claude's expected format
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": tool_use_id,
-                    "content": str(result.data if result.success else result.error_message)
-                })
-
-                # If website analysis succeeded, save analysis and create recommendations
-                if tool_name == "analyze_website" and result.success:
-                    # Ensure URL has scheme for Pydantic validation
-                    analyzed_url = result.data.get('url', tool_input["url"])
-                    if not analyzed_url.startswith(('http://', 'https://')):
-                        analyzed_url = f"https://{analyzed_url}"
-
-                    # Save the full website analysis to memory
-                    analysis = WebsiteAnalysis(
-                        url=analyzed_url,
-                        title=result.data.get('title'),
-                        meta_description=result.data.get('meta_description'),
-                        h1_tags=result.data.get('h1_tags', []),
-                        content_quality_score=result.data.get('content_quality_score'),
-                        ai_readiness_score=result.data.get('ai_readiness_score'),
-                        technical_issues=result.data.get('technical_issues', []),
-                        content_suggestions=result.data.get('content_suggestions', [])
-                    )
-                    self.memory.add_website_analysis(analysis)
-
-                    # Create and save recommendations
-                    recommendations = await self._create_recommendations(result.data)
-                    for rec in recommendations:
-                        self.memory.add_recommendation(rec)
+        tool_results = await self._run_requested_tools(tool_use_blocks)
 
         # Send tool results back to Claude for final response
-        messages = [
-            {
-                "role": "user",
-                "content": f"Context: {context}\n\nUser message: {user_message}" if context else user_message
-            },
-            {
-                "role": "assistant",
-                "content": initial_response.content
-            },
-            {
-                "role": "user",
-                "content": tool_results
-            }
-        ]
+        messages = self._tool_followup_messages(
+            initial_response, tool_results, user_message, context, history
+        )
 
-        final_response = self.claude.client.messages.create(
+        final_response = await self.claude.async_client.messages.create(
             model=self.claude.model,
             max_tokens=4000,
-            system=system_prompt,
+            system=self.claude.cached_system(system_prompt),
             messages=messages,
             tools=self.tool_schemas
         )
 
         return self._extract_text_from_response(final_response)
 
+    async def _run_requested_tools(self, tool_use_blocks: List[Any]) -> List[Dict[str, Any]]:
+        """Run the tools Claude asked for and return their tool_result blocks."""
+
+        # Execute all requested tools concurrently
+        async with SEOTools() as tools:
+            results = await asyncio.gather(*(
+                self._execute_single_tool(tools, tool_use.name, tool_use.input)
+                for tool_use in tool_use_blocks
+            ))
+
+        tool_results = []
+        for tool_use, result in zip(tool_use_blocks, results):
+            tool_name = tool_use.name
+            tool_input = tool_use.input
+
+            # Store result in Claude's expected format, as compact JSON rather than a repr
+            payload = result.data if result.success else {"error": result.error_message}
+            tool_results.append({
+                "type": "tool_result",
+                "tool_use_id": tool_use.id,
+                "content": json_utils.dumps(payload).decode('utf-8'),
+                "is_error": not result.success
+            })
+
+            # If website analysis succeeded, save analysis and create recommendations
+            if tool_name == "analyze_website" and result.success:
+                # Ensure URL has scheme for Pydantic validation
+                analyzed_url = result.data.get('url', tool_input["url"])
+                if not analyzed_url.startswith(('http://', 'https://')):
+                    analyzed_url = f"https://{analyzed_url}"
+
+                # Save the full website analysis to memory
+                analysis = WebsiteAnalysis(
+                    url=analyzed_url,
+                    title=result.data.get('title'),
+                    meta_description=result.data.get('meta_description'),
+                    h1_tags=result.data.get('h1_tags', []),
+                    content_quality_score=result.data.get('content_quality_score'),
+                    ai_readiness_score=result.data.get('ai_readiness_score'),
+                    technical_issues=result.data.get('technical_issues', []),
+                    content_suggestions=result.data.get('content_suggestions', [])
+                )
+                self.memory.add_website_analysis(analysis)
+
+                # Create and save recommendations
+                recommendations = await self._create_recommendations(result.data)
+                for rec in recommendations:
+                    self.memory.add_recommendation(rec)
+
+        return tool_results
+
+    def _tool_followup_messages(self, initial_response, tool_results: List[Dict[str, Any]],
+                                user_message: str, context: str,
+                                history: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, Any]]:
+        """Build the messages that hand tool results back to Claude."""
+        messages = self.claude.build_messages(user_message, context, history)
+        messages.extend([
+            {
+                "role": "assistant",
+                "content": initial_response.content
+            },
+            {
+                "role": "user",
+                "content": tool_results
+            }
+        ])
+        return messages
+
     async def _execute_single_tool(self, tools: SEOTools, tool_name: str, tool_input: Dict) -> ToolResponse:
         """Execute a single tool and return the result."""
         try:
-            if tool_name == "analyze_website":
-                return await tools.analyze_website(tool_input["url"])
-            elif tool_name == "compare_competitors":
-                return await tools.compare_competitors(
-                    tool_input["your_site"],
-                    tool_input["competitor_sites"]
-                )
-            elif tool_name == "check_ai_citations":
-                keywords = tool_input.get("keywords", [])
-                return await tools.check_ai_citations(tool_input["domain"], keywords)
-            elif tool_name == "track_performance":
-                timeframe = tool_input.get("timeframe", "30d")
-                return await tools.track_performance(tool_input["domain"], timeframe)
-            elif tool_name == "write_report_to_file":
-                return await tools.write_report_to_file(
-                    tool_input["filename"],
-                    tool_input["content"]
-                )
-            else:
+            handler = _TOOL_DISPATCH.get(tool_name)
+            if handler is None:
                 return ToolResponse(
                     tool_name=tool_name,
                     success=False,
                     error_message=f"Unknown tool: {tool_name}"
                 )
+            return await handler(tools, tool_input)
         except Exception as e:
             return ToolResponse(
                 tool_name=tool_name,
@@ -315,49 +428,56 @@ class SEOConsultant:
 
     async def _create_recommendations(self, analysis_data: Dict) -> List[SEORecommendation]:
         """Create SEO recommendations based on analysis data."""
-        recommendations = []
+        technical_issues = analysis_data.get('technical_issues', [])
+        content_suggestions = analysis_data.get('content_suggestions', [])
 
         # Technical issues recommendations
-        for issue in analysis_data.get('technical_issues', []):
-            rec = SEORecommendation(
-                id=str(uuid.uuid4()),
+        recommendations = [
+            SEORecommendation(
+                id=uuid.uuid4().hex,
                 title=f"Fix: {issue}",
                 description=f"Address the technical SEO issue: {issue}",
                 priority="high" if "missing" in issue.lower() else "medium",
                 category="technical_seo"
             )
-            recommendations.append(rec)
+            for issue in technical_issues
+        ]
 
         # Content suggestions recommendations
-        for suggestion in analysis_data.get('content_suggestions', []):
-            rec = SEORecommendation(
-                id=str(uuid.uuid4()),
+        recommendations.extend(
+            SEORecommendation(
+                id=uuid.uuid4().hex,
                 title=f"Content: {suggestion}",
                 description=f"Content optimization: {suggestion}",
                 priority="medium",
                 category="content_optimization"
             )
-            recommendations.append(rec)
+            for suggestion in content_suggestions
+        )
 
         # AI readiness improvements
         ai_score = analysis_data.get('ai_readiness_score', 0)
         if ai_score < 70:
-            rec = SEORecommendation(
-                id=str(uuid.uuid4()),
+            recommendations.append(SEORecommendation(
+                id=uuid.uuid4().hex,
                 title="Improve AI Search Readiness",
                 description=f"Your AI readiness score is {ai_score}%. Focus on structured content and schema markup.",
                 priority="high",
                 category="ai_optimization",
                 estimated_impact="High - Better AI citations"
-            )
-            recommendations.append(rec)
+            ))
 
         return recommendations
 
-    def _is_url(self, text: str) -> bool:
-        """Check if text appears to be a URL."""
-        return any(text.startswith(protocol) for protocol in ['http://', 'https://']) or \
-               ('.' in text and len(text.split('.')) >= 2 and ' ' not in text)
+    def _is_simple_welcome(self, session) -> bool:
+        """Whether the welcome needs no personalization (new session, empty profile)."""
+        profile = session.user_profile
+        return (
+            len(session.messages) == 0
+            and not session.recommendations
+            and not profile.website_url
+            and not profile.industry
+        )
 
     async def get_user_progress(self) -> Dict[str, Any]:
         """Get user's SEO progress summary."""
@@ -370,7 +490,7 @@ class SEOConsultant:
         in_progress = len([r for r in session.recommendations if r.implementation_status == "in_progress"])
 
         return {
-            'total_conversations': len(session.messages) // 2,
+            'total_conversations': self.memory.message_count(session) // 2,
             'recommendations': {
                 'total': total_recommendations,
                 'completed': completed,
@@ -379,7 +499,7 @@ class SEOConsultant:
             },
             'website_analyses': len(session.website_analyses),
             'last_activity': session.updated_at,
-            'user_profile': session.user_profile.dict()
+            'user_profile': session.user_profile.model_dump()
         }
 
     async def update_recommendation_status(self, recommendation_id: str, status: str) -> str:
@@ -389,7 +509,8 @@ class SEOConsultant:
         if status == "completed":
             congratulations = await self.claude.casual_conversation(
                 user_message=f"The user completed a recommendation with ID {recommendation_id}. Congratulate them and suggest next steps.",
-                context=self.memory.get_conversation_context()
+                context=self.memory.get_conversation_context(),
+                model=self.claude.fast_model
             )
             self.memory.add_message(ConversationRole.ASSISTANT, congratulations)
             return congratulations
@@ -404,15 +525,19 @@ class SEOConsultant:
             return None
 
         session = self.memory.current_session
-        days_since_update = (session.updated_at - session.created_at).days
+        if session.last_checkin_ts is None:
+            # Sessions start their first check-in week when they were created
+            session.last_checkin_ts = session.created_at.timestamp()
 
-        # Check if it's been a while since last interaction
-        if days_since_update >= 7:
+        # Check in at most once a week; a float compare is all a frequent poll costs
+        now = time.time()
+        if now - session.last_checkin_ts >= _CHECK_IN_INTERVAL:
             context = self.memory.get_user_summary()
             check_in = await self.claude.casual_conversation(
                 user_message="Generate a proactive check-in message for an SEO client we haven't heard from in a week",
                 context=context
             )
+            self.memory.record_check_in(now)
             return check_in
 
         return None
\ No newline at end of file
@@ -1,27 +1,63 @@
 import asyncio
-import aiohttp
 import time
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 from llm_seo_agent.utils.data_models import ToolResponse, WebsiteAnalysis, CompetitorAnalysis
+from llm_seo_agent.utils import json_utils
+from llm_seo_agent.utils.http_session import get_shared_session, read_text
+
+# Question-like sentences; the bounded run keeps matching linear on long pages
+_FAQ_RE = re.compile(r'\b(?:what|how|why|when|where|who)\b[^?\n]{0,200}\?', re.IGNORECASE)
+
+# FAQ detection only needs the start of the page text
+_FAQ_TEXT_LIMIT = 200_000
+
+# Only the start of a page carries the SEO markup we extract; skip the rest of huge pages
+_MAX_HTML_BYTES = 1_000_000
+
+
+def _schema_types(ld_json: str) -> List[str]:
+    """Extract the @type values from one JSON-LD block (including @graph entries)."""
+    try:
+        data = json_utils.loads(ld_json)
+    except ValueError:
+        return []
+
+    types = []
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if isinstance(item.get('@graph'), list):
+            items.extend(item['@graph'])
+        schema_type = item.get('@type')
+        if isinstance(schema_type, str):
+            types.append(schema_type)
+        elif isinstance(schema_type, list):
+            types.extend(t for t in schema_type if isinstance(t, str))
+    return types
 
 
 class SEOTools:
+    # url -> (fetched_at, analysis data); shared because SEOTools is created per chat turn
+    _analysis_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    analysis_cache_ttl = 300
+    analysis_cache_max = 256
+
     def __init__(self):
         self.session = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'SEO-Agent/1.0 (Educational purposes)'}
-        )
+        # Borrow the long-lived shared session so connections are pooled across chats
+        self.session = get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared session is closed on application shutdown, not per use
+        self.session = None
 
     async def analyze_website(self, url: str) -> ToolResponse:
         """Comprehensive website analysis for SEO."""
@@ -31,6 +67,15 @@ class SEOTools:
             if not url.startswith(('http://', 'https://')):
                 url = f"https://{url}"
 
+            cached = self._get_cached_analysis(url)
+            if cached is not None:
+                return ToolResponse(
+                    tool_name="analyze_website",
+                    success=True,
+                    data=cached,
+                    execution_time=time.time() - start_time
+                )
+
             async with self.session.get(url) as response:
                 if response.status != 200:
                     return ToolResponse(
@@ -39,10 +84,9 @@ class SEOTools:
                         error_message=f"HTTP {response.status}: Could not fetch {url}"
                     )
 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-
-                analysis_data = await self._perform_website_analysis(soup, url)
+                html = await read_text(response, _MAX_HTML_BYTES)
+                analysis_data = await self._perform_website_analysis(html, url)
+                self._cache_analysis(url, analysis_data)
 
                 execution_time = time.time() - start_time
                 return ToolResponse(
@@ -60,26 +104,66 @@ class SEOTools:
                 execution_time=time.time() - start_time
             )
 
-    async def _perform_website_analysis(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
-        """Perform detailed website analysis."""
+    def _get_cached_analysis(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a recent analysis of the URL, if one is still fresh."""
+        entry = self._analysis_cache.get(url)
+        if entry is None:
+            return None
 
-        # Basic SEO elements
-        title = soup.find('title')
-        title_text = title.get_text().strip() if title else None
+        fetched_at, data = entry
+        if time.monotonic() - fetched_at > self.analysis_cache_ttl:
+            del self._analysis_cache[url]
+            return None
+
+        return dict(data)
+
+    def _cache_analysis(self, url: str, data: Dict[str, Any]):
+        """Remember an analysis, evicting the oldest entries past the size cap."""
+        self._analysis_cache[url] = (time.monotonic(), dict(data))
+        self._analysis_cache.move_to_end(url)
 
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_desc_text = meta_desc.get('content', '').strip() if meta_desc else None
+        while len(self._analysis_cache) > self.analysis_cache_max:
+            self._analysis_cache.popitem(last=False)
 
-        # Heading structure
-        h1_tags = [h1.get_text().strip() for h1 in soup.find_all('h1')]
-        h2_tags = [h2.get_text().strip() for h2 in soup.find_all('h2')]
+    async def _perform_website_analysis(self, html: str, url: str) -> Dict[str, Any]:
+        """Perform detailed website analysis."""
+
+        tree = LexborHTMLParser(html)
 
-        # Content analysis
-        content_text = soup.get_text()
-        word_count = len(content_text.split())
+        # Basic SEO elements
+        title = tree.css_first('title')
+        meta_desc = tree.css_first('meta[name="description"]')
+        title_text = title.text().strip() if title else None
+        meta_desc_text = (meta_desc.attributes.get('content') or '').strip() if meta_desc else None
+
+        h1_tags = [node.text().strip() for node in tree.css('h1')]
+        h2_tags = [node.text().strip() for node in tree.css('h2')]
+        schema_scripts = tree.css('script[type="application/ld+json"]')
+        # Only the @type names are kept; full JSON-LD bodies would bloat the tool result
+        schema_types = list(dict.fromkeys(
+            schema_type
+            for script in schema_scripts
+            for schema_type in _schema_types(script.text())
+        ))
+
+        # Page text without script and style bodies, counted one text node at a
+        # time; only the leading text (bounded) is kept, for the FAQ scan
+        tree.strip_tags(['script', 'style'])
+        word_count = 0
+        leading_text: List[str] = []
+        leading_len = 0
+        if tree.body:
+            for node in tree.body.traverse(include_text=True):
+                text = node.text_content
+                if not text:
+                    continue
+                word_count += len(text.split())
+                if leading_len < _FAQ_TEXT_LIMIT:
+                    leading_text.append(text)
+                    leading_len += len(text) + 1
+        content_text = ' '.join(leading_text)[:_FAQ_TEXT_LIMIT]
 
         # Schema markup detection
-        schema_scripts = soup.find_all('script', type='application/ld+json')
         has_schema = len(schema_scripts) > 0
 
         # Technical SEO checks
@@ -117,7 +201,7 @@ class SEOTools:
         ai_readiness_score = sum(ai_readiness_factors.values()) / len(ai_readiness_factors) * 100
 
         # Content structure analysis for AI
-        question_patterns = re.findall(r'\b(?:what|how|why|when|where|who)\b.*?\?', content_text, re.IGNORECASE)
+        question_patterns = _FAQ_RE.findall(content_text)
         has_faq_structure = len(question_patterns) > 0
 
         if not has_faq_structure:
@@ -134,7 +218,7 @@ class SEOTools:
             'h2_tags': h2_tags,
             'word_count': word_count,
             'has_schema_markup': has_schema,
-            'schema_types': [script.get_text() for script in schema_scripts],
+            'schema_types': schema_types,
             'ai_readiness_score': round(ai_readiness_score, 1),
             'ai_readiness_factors': ai_readiness_factors,
             'technical_issues': technical_issues,
@@ -191,19 +275,25 @@ class SEOTools:
 
         try:
             results = {}
+            competitor_sites = competitor_sites[:3]  # Limit to 3 competitors
 
-            # Analyze your site
-            your_analysis = await self.analyze_website(your_site)
+            # Analyze your site and competitors concurrently on the shared session
+            your_analysis, *comp_analyses = await asyncio.gather(
+                self.analyze_website(your_site),
+                *(self.analyze_website(competitor) for competitor in competitor_sites),
+                return_exceptions=True
+            )
+
+            if isinstance(your_analysis, Exception):
+                raise your_analysis
             if not your_analysis.success:
                 return your_analysis
 
             results['your_site'] = your_analysis.data
 
-            # Analyze competitors
             results['competitors'] = {}
-            for competitor in competitor_sites[:3]:  # Limit to 3 competitors
-                comp_analysis = await self.analyze_website(competitor)
-                if comp_analysis.success:
+            for competitor, comp_analysis in zip(competitor_sites, comp_analyses):
+                if isinstance(comp_analysis, ToolResponse) and comp_analysis.success:
                     results['competitors'][competitor] = comp_analysis.data
 
             # Generate comparison insights
@@ -240,32 +330,31 @@ class SEOTools:
 
         your_word_count = your_data.get('word_count', 0)
         your_ai_score = your_data.get('ai_readiness_score', 0)
+        you_have_schema = your_data.get('has_schema_markup')
+        content_gap_threshold = your_word_count * 1.5
 
-        competitor_scores = []
-        competitor_word_counts = []
+        # Running total instead of collecting per-competitor lists
+        total_competitor_score = 0
 
         for comp_url, comp_data in competitors.items():
-            comp_score = comp_data.get('ai_readiness_score', 0)
             comp_word_count = comp_data.get('word_count', 0)
-
-            competitor_scores.append(comp_score)
-            competitor_word_counts.append(comp_word_count)
+            total_competitor_score += comp_data.get('ai_readiness_score', 0)
 
             # Check for schema markup advantages
-            if comp_data.get('has_schema_markup') and not your_data.get('has_schema_markup'):
+            if comp_data.get('has_schema_markup') and not you_have_schema:
                 insights['improvement_opportunities'].append(
                     f"Competitor {comp_url} uses schema markup - consider implementing"
                 )
 
             # Check content length
-            if comp_word_count > your_word_count * 1.5:
+            if comp_word_count > content_gap_threshold:
                 insights['content_gaps'].append(
                     f"Competitor has significantly more content ({comp_word_count} vs {your_word_count} words)"
                 )
 
         # Overall performance comparison
-        if competitor_scores:
-            avg_competitor_score = sum(competitor_scores) / len(competitor_scores)
+        if competitors:
+            avg_competitor_score = total_competitor_score / len(competitors)
             if your_ai_score < avg_competitor_score:
                 insights['improvement_opportunities'].append(
                     f"Your AI readiness score ({your_ai_score}%) is below competitor average ({avg_competitor_score:.1f}%)"
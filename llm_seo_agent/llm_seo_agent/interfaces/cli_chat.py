@@ -1,88 +1,231 @@
 import asyncio
+import inspect
+import re
 import sys
-from rich.console import Console
-from rich.prompt import Prompt
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.columns import Columns
+from rich.live import Live
+from rich.spinner import Spinner
 from rich.status import Status
-from rich.table import Table
 from rich.markdown import Markdown
-from rich.syntax import Syntax
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import signal
+import aiohttp
+import anthropic
+from prompt_toolkit import PromptSession
+from prompt_toolkit.completion import DummyCompleter, WordCompleter
+from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.validation import DummyValidator, Validator
 
 from llm_seo_agent.agent.conversation_manager import ConversationManager
+from llm_seo_agent.utils import event_loop
+
+
+# One console for the whole CLI; each Console probes the terminal when created
+console = Console()
+
+# Any character that suggests the reply uses markdown formatting
+_MD_MARKER_RE = re.compile(r'[*`#\-•]')
+
+# Redraws per second while a streamed reply is rendering
+_STREAM_REFRESH_PER_SECOND = 12
+
+# Errors a chat turn can recover from: network/timeouts and file I/O
+# (OSError), bad input and pydantic validation (ValueError), failed HTTP
+# requests (aiohttp.ClientError) and Claude API failures (anthropic.APIError);
+# anything else propagates to main()'s handler
+_RECOVERABLE = (OSError, ValueError, aiohttp.ClientError, anthropic.APIError)
+
+_EXIT_COMMANDS = frozenset(('/exit', '/quit', '/bye'))
+
+_INDUSTRIES = ["tech", "ecommerce", "b2b", "healthcare", "finance", "other"]
+
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "dismissed": "❌",
+}
+
+_PRIORITY_COLOR = {"high": "red", "medium": "yellow", "low": "green"}
+
+_WELCOME_TEXT = """
+💡 **Tips for better conversations:**
+• Share your website URL for personalized advice
+• Ask specific questions like "How do I optimize for AI search?"
+• Request analysis: "Analyze my website" or "Compare me to competitor.com"
+• Use `/help` to see all commands
+• Use `/export` to save your recommendations as markdown
+
+🚀 **Example questions:**
+• "My website isn't showing up in ChatGPT responses"
+• "How do I structure content for AI citations?"
+• "Analyze example.com for SEO opportunities"
+"""
+
+_HELP_TEXT = """**Chat Commands:**
+- Type naturally: "Analyze my website: example.com"
+- `/help` - Show this help
+- `/status` - View your progress
+- `/recommendations` - See your SEO recommendations
+- `/export` - Export report as markdown
+- `/exit` (or `/quit`, `/bye`) - End session
+- `exit` or `quit` (without slash) - Also works
+
+**Export Options:**
+- `/export` - Export with default filename
+- `/export -o myreport.md` - Export to specific file
+- `/export --with-conversation` - Include full chat history
+- `/export -o report.md -c` - Combine options
+
+**Analysis Requests:**
+- "Analyze [website-url]"
+- "Compare me to [competitor-url]"
+- "Check my AI search performance"
+- "How do I optimize for AI search?"
+
+**Recommendation Management:**
+- `/complete [rec-id]` - Mark recommendation as done
+- `/progress [rec-id]` - Mark as in progress
+"""
+
+# Static panels are built (and their markdown parsed) once at import
+_WELCOME_PANEL = Panel(
+    Markdown(_WELCOME_TEXT),
+    title="[bold green]Getting Started[/bold green]",
+    border_style="green",
+)
+
+_HELP_PANEL = Panel(
+    Markdown(_HELP_TEXT),
+    title="[bold yellow]Help & Commands[/bold yellow]",
+    border_style="yellow",
+)
+
+_FOOTER_PANEL = Panel.fit(
+    "Thanks for using LLM SEO Agent! Your conversation has been saved.",
+    border_style="dim",
+    title="[dim]Session Ended[/dim]",
+)
 
 
 class CLIChatInterface:
     def __init__(self, claude_api_key: Optional[str] = None):
-        self.console = Console()
+        self.console = console
         self.conversation_manager = ConversationManager(claude_api_key=claude_api_key)
         self.running = False
 
+        # Typing indicator shown until a reply starts streaming; reused every turn
+        self._thinking = Spinner("dots", text="[bold blue]Thinking...")
+
+        # (session_id, rendered session block) for /status
+        self._session_info: Optional[Tuple[str, Markdown]] = None
+
+        # Natively async line input, so reading a prompt needs no worker thread
+        self._prompt_session = PromptSession()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._input_future: Optional[asyncio.Future] = None
+
+        # Slash command -> handler taking the split command line
+        self._commands: Dict[str, Callable[[List[str]], Any]] = {
+            '/help': lambda cmd_parts: self._show_help_panel(),
+            '/export': self._handle_export_command,
+            '/status': lambda cmd_parts: self._show_status(),
+            '/recommendations': lambda cmd_parts: self._show_recommendations(),
+        }
+
         # Add message handler for CLI-specific formatting
         self.conversation_manager.add_message_handler(self._handle_message_event)
 
     async def start(self, user_id: str = None, website_url: str = None):
         """Start the CLI chat interface."""
         self.running = True
+        self._loop = asyncio.get_running_loop()
 
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._install_signal_handlers()
 
         self._show_header()
         self._show_welcome()
 
-        # Start conversation session
-        with Status("[bold blue]Starting conversation...", console=self.console, spinner="dots"):
-            welcome_message = await self.conversation_manager.start_session(user_id, website_url)
+        # Start conversation session, unless we're continuing one (e.g. after a quick analysis)
+        welcome = []
+        if not self.conversation_manager.is_active:
+            with Status("[bold blue]Starting conversation...", console=self.console, spinner="dots"):
+                welcome_message = await self.conversation_manager.start_session(user_id, website_url)
+            welcome = [Text(), self._agent_panel(welcome_message)]
 
-        # Show session ID
+        # Show session ID and the welcome message in one write
         session_id = self.conversation_manager.consultant.memory.current_session.session_id
-        self.console.print(f"[dim]📁 Session ID: {session_id}[/dim]")
-        self.console.print(
-            f"[dim]💾 Conversation saved to: data/conversations/{session_id}.json[/dim]"
+        self._flush_block(
+            f"[dim]📁 Session ID: {session_id}[/dim]",
+            f"[dim]💾 Conversation saved to: data/conversations/{session_id}.json[/dim]",
+            *welcome,
         )
-        self.console.print()
-
-        self._print_agent_message(welcome_message)
 
         # Main chat loop
         await self._chat_loop()
 
     async def _chat_loop(self):
         """Main chat interaction loop."""
-        while self.running:
-            try:
-                # Get user input
-                user_input = await self._get_user_input()
-
-                if not user_input or user_input.lower() in ['exit', 'quit', 'bye']:
-                    break
+        try:
+            while self.running:
+                try:
+                    # Get user input
+                    user_input = await self._get_user_input()
 
-                # Handle special commands
-                if user_input.startswith('/'):
-                    await self._handle_command(user_input)
-                    continue
+                    if not user_input or user_input.lower() in ['exit', 'quit', 'bye']:
+                        break
 
-                # Show typing indicator
-                with Status("[bold blue]Thinking...", console=self.console, spinner="dots"):
-                    response = await self.conversation_manager.process_message(user_input)
+                    # Handle special commands
+                    if user_input.startswith('/'):
+                        await self._handle_command(user_input)
+                        continue
 
-                self._print_agent_message(response)
+                    await self._stream_agent_response(user_input)
 
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                self.console.print(f"[red]Error: {e}[/red]")
+                except KeyboardInterrupt:
+                    break
+                except _RECOVERABLE as e:
+                    self.console.print(f"[red]Error: {e}[/red]")
+        finally:
+            # End the session even if an error escapes the loop, so debounced
+            # changes are flushed
+            goodbye = await self.conversation_manager.end_session()
 
-        # End session
-        goodbye = await self.conversation_manager.end_session()
         self._print_agent_message(goodbye)
         self._show_footer()
 
+    async def _stream_agent_response(self, user_input: str) -> str:
+        """Render the agent's reply progressively as it streams in."""
+        chunks = []
+        last_render = 0.0
+
+        # Typing indicator until the first chunk arrives. The Live itself is
+        # per turn: a restarted Live would erase the previous reply's lines
+        with Live(
+            self._thinking,
+            console=self.console,
+            refresh_per_second=_STREAM_REFRESH_PER_SECOND,
+            vertical_overflow="visible",
+        ) as live:
+            async for chunk in self.conversation_manager.process_message_stream(user_input):
+                chunks.append(chunk)
+
+                # Re-render (and re-parse the markdown) at most at the refresh rate
+                now = self._loop.time()
+                if now - last_render >= 1 / _STREAM_REFRESH_PER_SECOND:
+                    live.update(self._agent_panel("".join(chunks)))
+                    last_render = now
+
+            live.update(self._agent_panel("".join(chunks)))
+
+        return "".join(chunks)
+
     def _show_header(self):
         """Display the application header."""
         header_text = Text.assemble(
@@ -93,95 +236,94 @@ class CLIChatInterface:
 
         panel = Panel.fit(header_text, border_style="bright_blue", padding=(1, 2))
 
-        self.console.print()
-        self.console.print(panel)
-        self.console.print()
+        self._flush_block(Text(), panel, Text())
 
     def _show_welcome(self):
         """Display welcome information."""
-        welcome_text = """
-💡 **Tips for better conversations:**
-• Share your website URL for personalized advice
-• Ask specific questions like "How do I optimize for AI search?"
-• Request analysis: "Analyze my website" or "Compare me to competitor.com"
-• Use `/help` to see all commands
-• Use `/export` to save your recommendations as markdown
-
-🚀 **Example questions:**
-• "My website isn't showing up in ChatGPT responses"
-• "How do I structure content for AI citations?"
-• "Analyze example.com for SEO opportunities"
-"""
-
-        self.console.print(
-            Panel(
-                Markdown(welcome_text),
-                title="[bold green]Getting Started[/bold green]",
-                border_style="green",
-            )
-        )
-        self.console.print()
+        self._flush_block(_WELCOME_PANEL, Text())
 
     def _show_footer(self):
         """Display goodbye footer."""
-        footer = Panel.fit(
-            "Thanks for using LLM SEO Agent! Your conversation has been saved.",
-            border_style="dim",
-            title="[dim]Session Ended[/dim]",
-        )
-        self.console.print()
-        self.console.print(footer)
+        self._flush_block(Text(), _FOOTER_PANEL)
 
     async def _get_user_input(self) -> str:
         """Get user input with proper formatting."""
+        self._input_future = self._loop.create_task(
+            self._prompt_session.prompt_async(HTML("\n<ansigreen><b>You</b></ansigreen>: "))
+        )
         try:
-            # Create a future for the input
-            loop = asyncio.get_event_loop()
-            user_input = await loop.run_in_executor(
-                None, lambda: Prompt.ask("\n[bold green]You[/bold green]", console=self.console)
-            )
+            user_input = await self._input_future
             return user_input.strip()
         except EOFError:
             return "exit"
+        except KeyboardInterrupt:
+            # Ctrl-C while prompting is read as a key press, not delivered as SIGINT
+            self._request_stop()
+            return "exit"
+        except asyncio.CancelledError:
+            if self.running:
+                raise
+            # Cancelled by _request_stop: stop waiting for the pending prompt
+            return "exit"
+        finally:
+            self._input_future = None
 
     def _print_agent_message(self, message: str):
         """Print agent response with formatting."""
-        # Format the message
-        formatted_message = self._format_agent_response(message)
+        self._flush_block(self._agent_panel(message))
 
-        # Create panel with agent response
-        panel = Panel(
-            formatted_message,
+    def _flush_block(self, *renderables):
+        """Render a multi-line block off-screen, then write and flush it once."""
+        with self.console.capture() as capture:
+            self.console.print(Group(*renderables))
+
+        out = self.console.file
+        out.write(capture.get())
+        out.flush()
+
+    def _agent_panel(self, message: str) -> Panel:
+        """Build the panel that frames an agent response."""
+        return Panel(
+            self._format_agent_response(message),
             title="[bold blue]🤖 SEO Agent[/bold blue]",
             border_style="blue",
             padding=(1, 2),
         )
 
-        self.console.print(panel)
-
     def _format_agent_response(self, message: str):
         """Format agent response with rich formatting."""
         # If message contains markdown-like formatting, render as markdown
-        if any(marker in message for marker in ['**', '*', '`', '#', '-', '•']):
+        if _MD_MARKER_RE.search(message):
             return Markdown(message)
 
         # Otherwise, return as plain text
         return Text(message)
 
-    async def _handle_message_event(self, event_type: str, data: dict):
+    def _handle_message_event(self, event_type: str, data: dict):
         """Handle message events for CLI-specific formatting."""
-        if event_type == "session_start":
-            self.console.print(
-                f"[dim]Session started for user: {data.get('user_id', 'default')}[/dim]"
-            )
+        # Only session starts are shown; every other event returns straight away
+        if event_type != "session_start":
+            return
 
-        elif event_type == "message_exchange":
-            # Could add message logging or other CLI-specific handling here
-            pass
+        self.console.print(
+            f"[dim]Session started for user: {data.get('user_id', 'default')}[/dim]"
+        )
 
-        elif event_type == "session_end":
-            # Could add session summary here
-            pass
+    def _install_signal_handlers(self):
+        """Deliver SIGINT/SIGTERM through the event loop where supported."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, self._signal_handler)
+
+    def _request_stop(self):
+        """Stop the chat loop, abandoning a prompt that is waiting for input."""
+        self.console.print("\n[yellow]Shutting down gracefully...[/yellow]")
+        self.running = False
+        if self._input_future is not None:
+            self._input_future.cancel()
 
     def _signal_handler(self, signum, frame):
         """Handle interrupt signals gracefully."""
@@ -193,19 +335,13 @@ class CLIChatInterface:
         cmd_parts = command.split()
         cmd = cmd_parts[0].lower()
 
-        if cmd == '/help':
-            self._show_help_panel()
-
-        elif cmd == '/export':
-            await self._handle_export_command(cmd_parts)
-
-        elif cmd == '/status':
-            await self._show_status()
+        handler = self._commands.get(cmd)
+        if handler:
+            result = handler(cmd_parts)
+            if inspect.isawaitable(result):
+                await result
 
-        elif cmd == '/recommendations':
-            await self._show_recommendations()
-
-        elif cmd in ['/exit', '/quit', '/bye']:
+        elif cmd in _EXIT_COMMANDS:
             self.running = False
             self.console.print("[yellow]Ending session...[/yellow]")
 
@@ -215,9 +351,6 @@ class CLIChatInterface:
 
     async def _handle_export_command(self, cmd_parts: list):
         """Handle the /export command."""
-        from datetime import datetime
-        from pathlib import Path
-
         # Parse options
         include_conversation = '--with-conversation' in cmd_parts or '-c' in cmd_parts
 
@@ -232,27 +365,30 @@ class CLIChatInterface:
         if not output_file:
             output_file = f"seo_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
 
-        try:
-            # Export the current session
-            markdown_content = self.conversation_manager.consultant.memory.export_to_markdown(
-                output_path=output_file, include_conversation=include_conversation
-            )
+        memory = self.conversation_manager.consultant.memory
 
-            # Show success message
+        def export():
+            memory.write_markdown_report(output_file, include_conversation=include_conversation)
             file_path = Path(output_file).absolute()
+            return file_path, file_path.stat().st_size
 
+        try:
+            # Export the current session in a worker thread; it reads the
+            # message log and writes the report file
+            file_path, file_size = await asyncio.to_thread(export)
+
+            # Show success message
             success_panel = Panel(
                 f"[green]✅ Report exported successfully![/green]\n\n"
                 f"[bold]File:[/bold] {file_path}\n"
-                f"[bold]Size:[/bold] {len(markdown_content)} bytes\n"
+                f"[bold]Size:[/bold] {file_size} bytes\n"
                 f"[bold]Includes conversation:[/bold] {'Yes' if include_conversation else 'No'}\n\n"
                 f"[dim]You can now share this report with colleagues or clients![/dim]",
                 title="[bold green]Export Complete[/bold green]",
                 border_style="green",
             )
 
-            self.console.print()
-            self.console.print(success_panel)
+            self._flush_block(Text(), success_panel)
 
         except Exception as e:
             self.console.print(f"[red]❌ Export failed: {e}[/red]")
@@ -269,12 +405,15 @@ class CLIChatInterface:
         session = self.conversation_manager.consultant.memory.current_session
         session_id = session.session_id if session else "Unknown"
 
-        status_text = f"""
-**Session Info:**
-• Session ID: `{session_id}`
-• File: `data/conversations/{session_id}.json`
+        # The session block only changes with the session, so its markdown is parsed once
+        if self._session_info is None or self._session_info[0] != session_id:
+            self._session_info = (session_id, Markdown(
+                f"**Session Info:**\n"
+                f"• Session ID: `{session_id}`\n"
+                f"• File: `data/conversations/{session_id}.json`"
+            ))
 
-**Your SEO Journey:**
+        progress_text = f"""**Your SEO Journey:**
 • Total Conversations: {progress.get('total_conversations', 0)}
 • Recommendations: {progress['recommendations']['total']}
 • Completed: {progress['recommendations']['completed']}
@@ -284,14 +423,17 @@ class CLIChatInterface:
 """
 
         panel = Panel(
-            Markdown(status_text), title="[bold cyan]Your Progress[/bold cyan]", border_style="cyan"
+            Group(self._session_info[1], Text(), Markdown(progress_text)),
+            title="[bold cyan]Your Progress[/bold cyan]",
+            border_style="cyan",
         )
 
-        self.console.print()
-        self.console.print(panel)
+        self._flush_block(Text(), panel)
 
     async def _show_recommendations(self):
         """Show current recommendations."""
+        from rich.table import Table
+
         session = self.conversation_manager.consultant.memory.current_session
 
         if not session or not session.recommendations:
@@ -307,89 +449,78 @@ class CLIChatInterface:
         table.add_column("Priority", justify="center")
         table.add_column("Status", justify="center")
 
+        # Bound once outside the loop; the maps are shared module constants
+        add_row = table.add_row
+        priority_color_for = _PRIORITY_COLOR.get
+        status_emoji_for = _STATUS_EMOJI.get
+
         for rec in session.recommendations:
             # Color code priority
-            priority_color = {"high": "red", "medium": "yellow", "low": "green"}.get(
-                rec.priority, "white"
-            )
+            priority_color = priority_color_for(rec.priority, "white")
 
             # Status emoji
-            status_emoji = {
-                "pending": "⏳",
-                "in_progress": "🔄",
-                "completed": "✅",
-                "dismissed": "❌",
-            }.get(rec.implementation_status, "•")
-
-            table.add_row(
+            status_emoji = status_emoji_for(rec.implementation_status, "•")
+
+            add_row(
                 rec.id[:8],
                 rec.title,
                 f"[{priority_color}]{rec.priority.upper()}[/{priority_color}]",
                 f"{status_emoji} {rec.implementation_status}",
             )
 
-        self.console.print()
-        self.console.print(table)
+        self._flush_block(Text(), table)
 
     def _show_help_panel(self):
         """Show help information in a formatted panel."""
-        help_content = """**Chat Commands:**
-- Type naturally: "Analyze my website: example.com"
-- `/help` - Show this help
-- `/status` - View your progress
-- `/recommendations` - See your SEO recommendations
-- `/export` - Export report as markdown
-- `/exit` (or `/quit`, `/bye`) - End session
-- `exit` or `quit` (without slash) - Also works
-
-**Export Options:**
-- `/export` - Export with default filename
-- `/export -o myreport.md` - Export to specific file
-- `/export --with-conversation` - Include full chat history
-- `/export -o report.md -c` - Combine options
-
-**Analysis Requests:**
-- "Analyze [website-url]"
-- "Compare me to [competitor-url]"
-- "Check my AI search performance"
-- "How do I optimize for AI search?"
-
-**Recommendation Management:**
-- `/complete [rec-id]` - Mark recommendation as done
-- `/progress [rec-id]` - Mark as in progress
-"""
-
-        panel = Panel(
-            Markdown(help_content),
-            title="[bold yellow]Help & Commands[/bold yellow]",
-            border_style="yellow",
-        )
-
-        self.console.print(panel)
+        self._flush_block(_HELP_PANEL)
 
 
 class InteractiveCLI:
     """Enhanced CLI with interactive features."""
 
     def __init__(self, claude_api_key: Optional[str] = None):
-        self.console = Console()
+        self.console = console
         self.chat_interface = CLIChatInterface(claude_api_key=claude_api_key)
+        self._prompt_session = PromptSession()
+
+    async def _ask(self, message: str, default: str = "", choices: Optional[List[str]] = None) -> str:
+        """Prompt for one answer; with choices, completes and validates against them."""
+        if choices:
+            message = f"{message} [{'/'.join(choices)}]"
+            completer = WordCompleter(choices, ignore_case=True)
+            validator = Validator.from_callable(
+                lambda text: text.strip().lower() in choices,
+                error_message=f"Please choose one of: {', '.join(choices)}",
+            )
+        else:
+            # The session keeps the last completer/validator unless replaced
+            completer = DummyCompleter()
+            validator = DummyValidator()
+
+        answer = await self._prompt_session.prompt_async(
+            HTML(message + " "), default=default, completer=completer, validator=validator
+        )
+        return answer.strip().lower() if choices else answer.strip()
 
     async def run_interactive_setup(self):
         """Run interactive setup to gather user information."""
+        from rich.table import Table
+
         self.console.print(Panel.fit("🚀 Welcome to LLM SEO Agent Setup", style="bold blue"))
 
         # Get user information
         self.console.print("\n[bold]Let's get you set up for SEO success![/bold]")
 
-        user_id = Prompt.ask("[green]What's your name or company?[/green]", default="Anonymous")
+        user_id = await self._ask(
+            "<ansigreen>What's your name or company?</ansigreen>", default="Anonymous"
+        )
 
-        website_url = Prompt.ask("[green]What's your website URL?[/green] (optional)", default="")
+        website_url = await self._ask("<ansigreen>What's your website URL?</ansigreen> (optional)")
 
-        industry = Prompt.ask(
-            "[green]What industry are you in?[/green]",
-            choices=["tech", "ecommerce", "b2b", "healthcare", "finance", "other"],
+        industry = await self._ask(
+            "<ansigreen>What industry are you in?</ansigreen>",
             default="other",
+            choices=_INDUSTRIES,
         )
 
         # Show setup summary
@@ -406,8 +537,8 @@ class InteractiveCLI:
 
         # Confirm and start
         if (
-            Prompt.ask(
-                "\n[yellow]Start your SEO consultation?[/yellow]", choices=["y", "n"], default="y"
+            await self._ask(
+                "\n<ansiyellow>Start your SEO consultation?</ansiyellow>", default="y", choices=["y", "n"]
             )
             == "y"
         ):
@@ -419,9 +550,9 @@ class InteractiveCLI:
         """Run a quick website analysis without full chat interface."""
         self.console.print(Panel.fit(f"🔍 Quick Analysis: {url}", style="bold blue"))
 
-        # Start a temporary session
-        manager = ConversationManager()
-        await manager.start_session()
+        # Use the chat interface's manager, so a follow-up consultation continues this session
+        manager = self.chat_interface.conversation_manager
+        await manager.start_session(website_url=url)
 
         with Status("[bold blue]Analyzing website...", console=self.console, spinner="dots"):
             response = await manager.process_message(f"Analyze this website: {url}")
@@ -438,47 +569,62 @@ class InteractiveCLI:
 
         # Ask if they want to continue with full consultation
         if (
-            Prompt.ask(
-                "\n[yellow]Start full SEO consultation?[/yellow]", choices=["y", "n"], default="n"
+            await self._ask(
+                "\n<ansiyellow>Start full SEO consultation?</ansiyellow>", default="n", choices=["y", "n"]
             )
             == "y"
         ):
             await self.chat_interface.start(website_url=url)
 
 
-async def main():
-    """Main CLI entry point."""
+async def run_mode(api_key: Optional[str] = None, url: Optional[str] = None, setup: bool = False):
+    """Run one CLI mode: quick analysis of url, interactive setup, or direct chat."""
+    # Single user: only session saves and /export go to threads, so two workers are
+    # enough (the loop shuts the executor down when it closes)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=2, thread_name_prefix="cli")
+    )
+
+    if url:
+        await InteractiveCLI(claude_api_key=api_key).run_quick_analysis(url)
+    elif setup:
+        await InteractiveCLI(claude_api_key=api_key).run_interactive_setup()
+    else:
+        await CLIChatInterface(claude_api_key=api_key).start()
+
+
+def _build_parser():
+    """Build the CLI argument parser; each mode is a subcommand (chat is the default)."""
     import argparse
 
     parser = argparse.ArgumentParser(description="LLM SEO Agent CLI")
-    parser.add_argument("--url", help="Quick analyze a website URL")
-    parser.add_argument("--setup", action="store_true", help="Run interactive setup")
     parser.add_argument("--api-key", help="Claude API key (or set CLAUDE_API_KEY env var)")
+    parser.add_argument("--url", help="Quick analyze a website URL (same as 'quick URL')")
+    parser.add_argument(
+        "--setup", action="store_true", help="Run interactive setup (same as 'setup')"
+    )
 
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers()
+    subparsers.add_parser("chat", help="Start a chat session")
+    subparsers.add_parser("setup", help="Run interactive setup").set_defaults(setup=True)
+    subparsers.add_parser("quick", help="Quick analyze a website URL").add_argument("url")
 
-    try:
-        if args.url:
-            # Quick analysis mode
-            cli = InteractiveCLI(claude_api_key=args.api_key)
-            await cli.run_quick_analysis(args.url)
+    return parser
 
-        elif args.setup:
-            # Interactive setup mode
-            cli = InteractiveCLI(claude_api_key=args.api_key)
-            await cli.run_interactive_setup()
 
-        else:
-            # Direct chat mode
-            chat = CLIChatInterface(claude_api_key=args.api_key)
-            await chat.start()
+async def main():
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
+
+    try:
+        await run_mode(args.api_key, args.url, args.setup)
 
     except KeyboardInterrupt:
-        Console().print("\n[yellow]Goodbye![/yellow]")
+        console.print("\n[yellow]Goodbye![/yellow]")
     except Exception as e:
-        Console().print(f"[red]Error: {e}[/red]")
+        console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -1,5 +1,4 @@
 import streamlit as st
-import asyncio
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
@@ -8,6 +7,7 @@ from typing import Dict, Any, List
 import json
 
 from llm_seo_agent.agent.conversation_manager import ConversationManager
+from llm_seo_agent.utils import event_loop
 
 
 class StreamlitWebInterface:
@@ -190,7 +190,7 @@ class StreamlitWebInterface:
 
             with st.chat_message("assistant"):
                 with st.spinner("Thinking..."):
-                    response = asyncio.run(self.get_ai_response(content))
+                    response = event_loop.run(self.get_ai_response(content))
 
                 st.markdown(response)
 
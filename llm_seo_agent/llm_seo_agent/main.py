@@ -5,41 +5,45 @@ LLM SEO Agent - Your AI Search Optimization Consultant
 Main entry point for the conversational SEO agent.
 """
 
-import asyncio
 import sys
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import click
 import yaml
-from rich.console import Console
 from rich.panel import Panel
 
-from .interfaces.cli_chat import CLIChatInterface, InteractiveCLI, main as cli_main
+from .interfaces.cli_chat import console, run_mode
 from .agent.conversation_manager import ConversationManager
+from .utils import event_loop
 
 
-console = Console()
+# A config value that is entirely an environment variable reference, e.g. "${CLAUDE_API_KEY}"
+_ENV_RE = re.compile(r'^\$\{([^}]+)\}$')
 
 
+def _expand_env_vars(obj):
+    """Replace "${VAR}" strings in a parsed config with the environment value."""
+    if isinstance(obj, dict):
+        return {k: _expand_env_vars(v) for k, v in obj.items()}
+    elif isinstance(obj, str):
+        match = _ENV_RE.match(obj)
+        return os.getenv(match.group(1), obj) if match else obj
+    else:
+        return obj
+
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from settings.yaml."""
+    """Load configuration from settings.yaml (parsed once per process; don't mutate it)."""
     config_path = Path(__file__).parent / "config" / "settings.yaml"
 
     if config_path.exists():
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
 
-        # Expand environment variables
-        def expand_env_vars(obj):
-            if isinstance(obj, dict):
-                return {k: expand_env_vars(v) for k, v in obj.items()}
-            elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-                env_var = obj[2:-1]
-                return os.getenv(env_var, obj)
-            else:
-                return obj
-
-        return expand_env_vars(config)
+        return _expand_env_vars(config)
 
     return {}
 
@@ -68,18 +72,7 @@ def chat(url, setup, api_key):
     """Start interactive chat with the SEO agent."""
 
     try:
-        if url:
-            # Quick analysis mode
-            cli = InteractiveCLI(claude_api_key=api_key)
-            asyncio.run(cli.run_quick_analysis(url))
-        elif setup:
-            # Interactive setup mode
-            cli = InteractiveCLI(claude_api_key=api_key)
-            asyncio.run(cli.run_interactive_setup())
-        else:
-            # Direct chat mode
-            chat_interface = CLIChatInterface(claude_api_key=api_key)
-            asyncio.run(chat_interface.start())
+        event_loop.run(run_mode(api_key, url, setup))
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Goodbye![/yellow]")
@@ -162,7 +155,7 @@ def analyze(url, output_format, api_key):
         except Exception as e:
             console.print(f"[red]Analysis failed: {e}[/red]")
 
-    asyncio.run(run_analysis())
+    event_loop.run(run_analysis())
 
 
 @main.command()
@@ -199,7 +192,7 @@ def compare(your_site, competitors, api_key):
         except Exception as e:
             console.print(f"[red]Comparison failed: {e}[/red]")
 
-    asyncio.run(run_comparison())
+    event_loop.run(run_comparison())
 
 
 @main.command()
@@ -316,17 +309,14 @@ def export(output, with_conversation, user_id):
 
         # Export to markdown
         console.print(f"[blue]Exporting session {session.session_id[:8]}...[/blue]")
-        markdown_content = memory.export_to_markdown(
-            output_path=output,
-            include_conversation=with_conversation
-        )
+        memory.write_markdown_report(output, include_conversation=with_conversation)
 
         console.print(f"[green]✅ Report exported successfully![/green]")
         console.print(f"[green]📄 File: {output}[/green]")
         console.print(f"\n[dim]Summary:[/dim]")
         console.print(f"  • Recommendations: {len(session.recommendations)}")
         console.print(f"  • Website analyses: {len(session.website_analyses)}")
-        console.print(f"  • Conversations: {len(session.messages) // 2}")
+        console.print(f"  • Conversations: {memory.message_count(session) // 2}")
 
         if with_conversation:
             console.print(f"  • Full conversation history included")
@@ -7,6 +7,9 @@ import spacy
 from textstat import flesch_reading_ease, flesch_kincaid_grade
 import numpy as np
 
+# Elements that hold no main content (code, styling, site chrome)
+_NON_CONTENT_TAGS = ['script', 'style', 'noscript', 'template', 'nav', 'header', 'footer', 'aside']
+
 
 class ContentAnalyzer:
     """Advanced content analysis for SEO optimization."""
@@ -25,7 +28,7 @@ class ContentAnalyzer:
 
     def analyze_content(self, html_content: str, url: str = "") -> Dict[str, Any]:
         """Comprehensive content analysis."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
 
         # Extract text content
         text_content = self._extract_clean_text(soup)
@@ -65,7 +68,7 @@ class ContentAnalyzer:
     def _extract_clean_text(self, soup: BeautifulSoup) -> str:
         """Extract clean text content from HTML."""
         # Remove script, style, and other non-content elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        for element in soup.find_all(_NON_CONTENT_TAGS):
             element.decompose()
 
         # Get text and clean it
@@ -1,15 +1,93 @@
 import asyncio
 import aiohttp
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import List, Dict, Set, Optional, Any
+from collections import deque
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from io import BytesIO
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from typing import Deque, List, Dict, Optional, Any
+import random
+import sys
 import time
 import re
 from dataclasses import dataclass
 from llm_seo_agent.utils.data_models import WebsiteAnalysis
+from llm_seo_agent.utils.http_session import get_shared_session, read_text
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pybloom-live is an optional speedup (install the "fast" extra)
+    ScalableBloomFilter = None
 
-@dataclass
+_SITEMAP_TAGS = ('{*}url', '{*}sitemap')
+_URL_FIELDS = ('lastmod', 'changefreq', 'priority')
+_MAX_SITEMAP_FETCHES = 8
+
+# Per-request settings, since the crawlers borrow the shared session
+_PAGE_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+_PAGE_HEADERS = {'User-Agent': 'SEO-Analyzer/1.0 (Educational Research)'}
+_MAX_PAGE_BYTES = 2_000_000  # Bodies past this are cut off rather than downloaded and parsed
+_SITEMAP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_SITEMAP_HEADERS = {'User-Agent': 'SEO-Analyzer/1.0 (Sitemap Parser)'}
+
+# Retries for transient page failures (rate limiting, overload, dropped connections)
+_RETRY_STATUSES = (429, 503)
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF = 1.0
+_MAX_RETRY_AFTER = 30.0
+
+# Everything _extract_meta_data needs, matched in a single tree walk
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_META_SELECTOR = 'meta, script[type="application/ld+json"], ' + ', '.join(_HEADING_TAGS)
+
+# Page text: elements whose contents never render as text, and whitespace cleanup
+_NON_TEXT_TAGS = ['script', 'style', 'noscript', 'template']
+_INLINE_WS_RE = re.compile(r'[^\S\n]+')
+_LINE_BREAKS_RE = re.compile(r' ?\n\s*')
+
+# ContentAnalyzer patterns
+# One match per sentence: a run up to the next terminator holding non-whitespace
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+_QUESTION_RE = re.compile(r'\b(?:what|how|why|when|where|who)\b.*?\?', re.IGNORECASE)
+_HEADER_LINE_RE = re.compile(r'\n[A-Z][^.]*\n')
+
+
+@lru_cache(maxsize=65536)
+def _canonicalize(url: str) -> str:
+    """Normalize a URL for visited checks: no fragment, lowercase host, sorted query."""
+    parts = urlsplit(url)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_')
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/',
+                       urlencode(query), ''))
+
+
+@lru_cache(maxsize=16384)
+def _netloc(url: str) -> str:
+    """Network location of a URL (cached: the same links recur across pages)."""
+    return urlsplit(url).netloc
+
+
+def _new_seen_set():
+    """Container for visited URLs: supports `in` and add().
+
+    A scalable Bloom filter when installed (~10 bits per URL, 0.1% false
+    positives, i.e. a rare page skipped), otherwise an exact set.
+    """
+    if ScalableBloomFilter is not None:
+        return ScalableBloomFilter(initial_capacity=10_000, error_rate=0.001)
+    return set()
+
+
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+ and
+# the project supports 3.9 (see requires-python), so it is applied by version check
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CrawlResult:
     url: str
     title: str
@@ -24,174 +102,248 @@ class CrawlResult:
 class WebCrawler:
     """Advanced web crawler for SEO analysis."""
 
-    def __init__(self, max_concurrent: int = 5, delay: float = 1.0):
+    def __init__(self, max_concurrent: int = 5, delay: float = 1.0,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.max_concurrent = max_concurrent
         self.delay = delay
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.visited_urls: Set[str] = set()
+        self.session = session
+        self.visited_urls = _new_seen_set()  # Canonical URLs, see _canonicalize
+        self._host_starts: Dict[str, Deque[float]] = {}  # Start times of each host's last requests
 
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        self.session = aiohttp.ClientSession(
-            timeout=timeout,
-            headers={
-                'User-Agent': 'SEO-Analyzer/1.0 (Educational Research)'
-            }
-        )
+        # Reuse pooled connections instead of opening a session per crawl
+        if self.session is None:
+            self.session = get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The session is shared or borrowed, so its owner closes it
+        pass
 
     async def crawl_website(self, start_url: str, max_pages: int = 10) -> List[CrawlResult]:
         """Crawl a website starting from the given URL."""
         if not self.session:
             raise RuntimeError("Crawler must be used as async context manager")
 
-        results = []
-        urls_to_crawl = [start_url]
-        crawled_count = 0
-
-        # Create semaphore for concurrent control
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        while urls_to_crawl and crawled_count < max_pages:
-            # Get batch of URLs to crawl
-            batch_size = min(self.max_concurrent, len(urls_to_crawl), max_pages - crawled_count)
-            current_batch = urls_to_crawl[:batch_size]
-            urls_to_crawl = urls_to_crawl[batch_size:]
-
-            # Crawl batch concurrently
-            tasks = [
-                self._crawl_single_page(url, semaphore)
-                for url in current_batch
-                if url not in self.visited_urls
-            ]
-
-            if not tasks:
-                break
-
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in batch_results:
-                if isinstance(result, CrawlResult) and result.error is None:
+        results: List[CrawlResult] = []
+        frontier: asyncio.Queue = asyncio.Queue()
+        frontier.put_nowait(start_url)
+        domain = _netloc(start_url)
+        in_flight = 0
+        held: List[str] = []  # URLs waiting on pages that may still fail, see visit()
+
+        async def visit(url: str):
+            nonlocal in_flight
+            canonical = _canonicalize(url)
+            if canonical in self.visited_urls or len(results) >= max_pages:
+                return
+            if len(results) + in_flight >= max_pages:
+                # The remaining pages are only reserved by fetches in flight;
+                # hold the URL in case one of them fails instead of dropping it
+                held.append(url)
+                return
+            self.visited_urls.add(canonical)
+
+            in_flight += 1
+            crawled = False
+            try:
+                result = await self._crawl_single_page(url)
+                if result.error is None:
                     results.append(result)
-                    crawled_count += 1
+                    crawled = True
 
                     # Extract internal links for further crawling
-                    domain = urlparse(start_url).netloc
                     internal_links = [
                         link for link in result.links
-                        if urlparse(link).netloc == domain and link not in self.visited_urls
+                        if _netloc(link) == domain and _canonicalize(link) not in self.visited_urls
                     ]
-                    urls_to_crawl.extend(internal_links[:5])  # Limit new links per page
-
-            # Rate limiting delay
-            if urls_to_crawl:
-                await asyncio.sleep(self.delay)
+                    for link in internal_links[:5]:  # Limit new links per page
+                        frontier.put_nowait(link)
+            finally:
+                in_flight -= 1
+                if not crawled:
+                    # This page's reservation is free again: retry the held URLs
+                    for held_url in held:
+                        frontier.put_nowait(held_url)
+                    held.clear()
+
+        async def worker():
+            while True:
+                url = await frontier.get()
+                try:
+                    await visit(url)
+                except Exception as e:
+                    # A bad URL must not take the worker down (frontier.join() would hang)
+                    print(f"Error crawling {url}: {e}")
+                finally:
+                    frontier.task_done()
+
+        # Workers pull from the frontier continuously, so a slow page never
+        # holds back the rest of a batch; the pool size is the concurrency limit
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrent)]
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         return results
 
-    async def _crawl_single_page(self, url: str, semaphore: asyncio.Semaphore) -> CrawlResult:
-        """Crawl a single page and extract data."""
-        async with semaphore:
+    async def _crawl_single_page(self, url: str) -> CrawlResult:
+        """Crawl a single page and extract data, retrying transient failures."""
+        # Jittered so pages that fail together don't retry in lockstep
+        backoff = random.uniform(0.5, 1.5) * _RETRY_BACKOFF
+
+        for attempt in range(_MAX_ATTEMPTS):
+            last_attempt = attempt == _MAX_ATTEMPTS - 1
+            await self._wait_for_host(url)
             start_time = time.time()
 
             try:
-                self.visited_urls.add(url)
-
-                async with self.session.get(url) as response:
-                    load_time = time.time() - start_time
-                    content = await response.text()
-
-                    soup = BeautifulSoup(content, 'html.parser')
-
-                    # Extract page data
-                    title = self._extract_title(soup)
-                    text_content = self._extract_text_content(soup)
-                    links = self._extract_links(soup, url)
-                    meta_data = self._extract_meta_data(soup)
-
-                    return CrawlResult(
-                        url=url,
-                        title=title,
-                        content=text_content,
-                        links=links,
-                        meta_data=meta_data,
-                        status_code=response.status,
-                        load_time=load_time
-                    )
+                async with self.session.get(url, timeout=_PAGE_TIMEOUT,
+                                            headers=_PAGE_HEADERS) as response:
+                    if response.status in _RETRY_STATUSES and not last_attempt:
+                        delay = _retry_after(response.headers.get('Retry-After'), backoff)
+                    else:
+                        return await self._build_result(url, response, start_time)
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    return _failed_result(url, start_time, e)
+                delay = backoff
 
             except Exception as e:
-                return CrawlResult(
-                    url=url,
-                    title="",
-                    content="",
-                    links=[],
-                    meta_data={},
-                    status_code=0,
-                    load_time=time.time() - start_time,
-                    error=str(e)
-                )
+                return _failed_result(url, start_time, e)
+
+            await asyncio.sleep(delay)
+            backoff *= 2
+
+    async def _wait_for_host(self, url: str):
+        """Allow each host up to max_concurrent requests per ~delay window; other hosts aren't held up."""
+        loop = asyncio.get_running_loop()
+        host = _netloc(url)
+
+        starts = self._host_starts.get(host)
+        if starts is None:
+            starts = self._host_starts[host] = deque(maxlen=self.max_concurrent)
+
+        # No await between the read and the update, so no lock is needed
+        now = loop.time()
+        start = now
+        if len(starts) == starts.maxlen:
+            # Budget used up: go once the oldest request in the window is ~delay old
+            start = max(now, starts[0] + self.delay + random.uniform(0, 0.3 * self.delay))
+        starts.append(start)
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _build_result(self, url: str, response: aiohttp.ClientResponse,
+                            start_time: float) -> CrawlResult:
+        """Read a page response and extract its data."""
+        load_time = time.time() - start_time
+        content = await read_text(response, _MAX_PAGE_BYTES)
+
+        tree = LexborHTMLParser(content)
+
+        # Extract page data (text last: it strips script/style from the tree)
+        title = self._extract_title(tree)
+        links = self._extract_links(tree, url)
+        meta_data = self._extract_meta_data(tree)
+        text_content = self._extract_text_content(tree)
+
+        return CrawlResult(
+            url=url,
+            title=title,
+            content=text_content,
+            links=links,
+            meta_data=meta_data,
+            status_code=response.status,
+            load_time=load_time
+        )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: LexborHTMLParser) -> str:
         """Extract page title."""
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else ""
+        title_tag = tree.css_first('title')
+        return title_tag.text().strip() if title_tag else ""
 
-    def _extract_text_content(self, soup: BeautifulSoup) -> str:
-        """Extract main text content."""
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+    def _extract_text_content(self, tree: LexborHTMLParser) -> str:
+        """Extract main text content (destructive: strips non-text elements)."""
+        # Remove non-text elements in one native pass (mutates the tree, so
+        # _crawl_single_page runs this extractor last)
+        tree.strip_tags(_NON_TEXT_TAGS)
 
-        # Get text content
-        text = soup.get_text()
+        # Get text content, one line per text node so elements don't run together
+        text = tree.root.text(separator='\n') if tree.root else ""
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Clean up whitespace: collapse runs within lines, drop blank lines
+        text = _INLINE_WS_RE.sub(' ', text)
+        return _LINE_BREAKS_RE.sub('\n', text).strip()
 
-        return text
-
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_links(self, tree: LexborHTMLParser, base_url: str) -> List[str]:
         """Extract all links from the page."""
         links = []
+        seen_hrefs = set()
+        seen_links = set()
 
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(base_url, href)
+        for link in tree.css('a[href]'):
+            href = link.attrs.get('href') or ''
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
 
-            # Filter out non-HTTP links
-            if absolute_url.startswith(('http://', 'https://')):
+            try:
+                if href.startswith(('http://', 'https://')):
+                    # Absolute links need no resolving against the page URL, only a
+                    # validity check (urljoin would have raised on malformed ones)
+                    urlsplit(href)
+                    absolute_url = href
+                else:
+                    absolute_url = urljoin(base_url, href)
+            except ValueError:
+                continue  # Malformed URL, e.g. an unclosed IPv6 host
+
+            # Filter out non-HTTP links and duplicates
+            if absolute_url.startswith(('http://', 'https://')) and absolute_url not in seen_links:
+                seen_links.add(absolute_url)
                 links.append(absolute_url)
 
-        return list(set(links))  # Remove duplicates
+        return links
 
-    def _extract_meta_data(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_meta_data(self, tree: LexborHTMLParser) -> Dict[str, str]:
         """Extract meta data from the page."""
         meta_data = {}
-
-        # Extract meta tags
-        for meta in soup.find_all('meta'):
-            if meta.get('name'):
-                meta_data[meta['name']] = meta.get('content', '')
-            elif meta.get('property'):
-                meta_data[meta['property']] = meta.get('content', '')
+        schema_count = 0
+        heading_counts: Dict[str, int] = {}
+        heading_first: Dict[str, str] = {}
+
+        # One query for meta tags, structured data and headings, bucketed by tag
+        for node in tree.css(_META_SELECTOR):
+            tag = node.tag
+            if tag == 'meta':
+                attrs = node.attrs
+                if attrs.get('name'):
+                    meta_data[attrs['name']] = attrs.get('content') or ''
+                elif attrs.get('property'):
+                    meta_data[attrs['property']] = attrs.get('content') or ''
+            elif tag == 'script':
+                schema_count += 1
+            elif tag in heading_counts:
+                heading_counts[tag] += 1
+            else:
+                heading_counts[tag] = 1
+                heading_first[tag] = node.text().strip()
 
         # Extract structured data
-        schema_scripts = soup.find_all('script', type='application/ld+json')
-        if schema_scripts:
-            meta_data['structured_data_count'] = str(len(schema_scripts))
+        if schema_count:
+            meta_data['structured_data_count'] = str(schema_count)
 
         # Extract heading structure
-        for i in range(1, 7):
-            headings = soup.find_all(f'h{i}')
-            if headings:
-                meta_data[f'h{i}_count'] = str(len(headings))
-                meta_data[f'h{i}_first'] = headings[0].get_text().strip()
+        for tag in _HEADING_TAGS:
+            if tag in heading_counts:
+                meta_data[f'{tag}_count'] = str(heading_counts[tag])
+                meta_data[f'{tag}_first'] = heading_first[tag]
 
         return meta_data
 
@@ -199,19 +351,20 @@ class WebCrawler:
 class SitemapCrawler:
     """Specialized crawler for XML sitemaps."""
 
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.session = session
+        self._fetch_limit: Optional[asyncio.Semaphore] = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'SEO-Analyzer/1.0 (Sitemap Parser)'}
-        )
+        # Shared by every (recursive) parse_sitemap call so index fan-out stays bounded
+        self._fetch_limit = asyncio.Semaphore(_MAX_SITEMAP_FETCHES)
+        if self.session is None:
+            self.session = get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The session is shared or borrowed, so its owner closes it
+        pass
 
     async def discover_sitemaps(self, domain: str) -> List[str]:
         """Discover sitemap URLs for a domain."""
@@ -228,21 +381,29 @@ class SitemapCrawler:
             '/sitemaps.xml'
         ]
 
-        for path in common_paths:
-            url = urljoin(domain, path)
-            if await self._check_sitemap_exists(url):
+        # Probe the common paths and robots.txt sitemap declarations in one round trip
+        candidates = [urljoin(domain, path) for path in common_paths]
+        results = await asyncio.gather(
+            *(self._check_sitemap_exists(url) for url in candidates),
+            self._get_sitemaps_from_robots(domain),
+            return_exceptions=True
+        )
+
+        for url, exists in zip(candidates, results):
+            if exists is True:
                 sitemap_urls.append(url)
 
-        # Check robots.txt for sitemap declarations
-        robots_sitemaps = await self._get_sitemaps_from_robots(domain)
-        sitemap_urls.extend(robots_sitemaps)
+        robots_sitemaps = results[-1]
+        if not isinstance(robots_sitemaps, BaseException):
+            sitemap_urls.extend(robots_sitemaps)
 
         return list(set(sitemap_urls))
 
     async def _check_sitemap_exists(self, url: str) -> bool:
         """Check if a sitemap exists at the given URL."""
         try:
-            async with self.session.head(url) as response:
+            async with self.session.head(url, timeout=_SITEMAP_TIMEOUT,
+                                         headers=_SITEMAP_HEADERS) as response:
                 return response.status == 200
         except:
             return False
@@ -253,7 +414,8 @@ class SitemapCrawler:
         sitemaps = []
 
         try:
-            async with self.session.get(robots_url) as response:
+            async with self.session.get(robots_url, timeout=_SITEMAP_TIMEOUT,
+                                        headers=_SITEMAP_HEADERS) as response:
                 if response.status == 200:
                     content = await response.text()
 
@@ -272,58 +434,83 @@ class SitemapCrawler:
     async def parse_sitemap(self, sitemap_url: str) -> List[Dict[str, Any]]:
         """Parse an XML sitemap and extract URLs."""
         try:
-            async with self.session.get(sitemap_url) as response:
-                if response.status != 200:
-                    return []
-
-                content = await response.text()
-                soup = BeautifulSoup(content, 'xml')
-
-                urls = []
-
-                # Handle sitemap index files
-                sitemap_tags = soup.find_all('sitemap')
-                if sitemap_tags:
-                    for sitemap in sitemap_tags:
-                        loc = sitemap.find('loc')
-                        if loc:
-                            # Recursively parse sub-sitemaps
-                            sub_urls = await self.parse_sitemap(loc.get_text())
-                            urls.extend(sub_urls)
-
-                # Handle regular sitemap files
-                url_tags = soup.find_all('url')
-                for url_tag in url_tags:
-                    loc = url_tag.find('loc')
-                    if loc:
-                        url_data = {
-                            'url': loc.get_text(),
-                            'lastmod': None,
-                            'changefreq': None,
-                            'priority': None
-                        }
-
-                        # Extract additional data if available
-                        lastmod = url_tag.find('lastmod')
-                        if lastmod:
-                            url_data['lastmod'] = lastmod.get_text()
-
-                        changefreq = url_tag.find('changefreq')
-                        if changefreq:
-                            url_data['changefreq'] = changefreq.get_text()
-
-                        priority = url_tag.find('priority')
-                        if priority:
-                            url_data['priority'] = priority.get_text()
-
+            content = await self._fetch_sitemap(sitemap_url)
+            if content is None:
+                return []
+
+            urls = []
+            sub_sitemaps = []
+
+            # Stream the XML so only one <url>/<sitemap> entry is in memory at a time
+            for _, elem in etree.iterparse(BytesIO(content), events=('end',),
+                                           tag=_SITEMAP_TAGS, recover=True):
+                loc = _child_text(elem, 'loc')
+                if loc:
+                    if etree.QName(elem).localname == 'sitemap':
+                        sub_sitemaps.append(loc)
+                    else:
+                        url_data = {'url': loc}
+                        for field in _URL_FIELDS:
+                            url_data[field] = _child_text(elem, field)
                         urls.append(url_data)
 
-                return urls
+                elem.clear(keep_tail=True)
+
+            # Recursively parse sub-sitemaps from sitemap index files, concurrently
+            if sub_sitemaps:
+                results = await asyncio.gather(
+                    *(self.parse_sitemap(loc) for loc in sub_sitemaps),
+                    return_exceptions=True
+                )
+                for sub_urls in results:
+                    if not isinstance(sub_urls, BaseException):
+                        urls.extend(sub_urls)
+
+            return urls
 
         except Exception as e:
             print(f"Error parsing sitemap {sitemap_url}: {e}")
             return []
 
+    async def _fetch_sitemap(self, sitemap_url: str) -> Optional[bytes]:
+        """Download a sitemap body, or None if it isn't available."""
+        # Only the download holds the semaphore, so nested sitemaps can't deadlock it
+        async with self._fetch_limit:
+            async with self.session.get(sitemap_url, timeout=_SITEMAP_TIMEOUT,
+                                        headers=_SITEMAP_HEADERS) as response:
+                if response.status != 200:
+                    return None
+                return await response.read()
+
+
+def _retry_after(header: Optional[str], default: float) -> float:
+    """Seconds to wait from a Retry-After header, falling back to the backoff."""
+    if header and header.strip().isdigit():
+        return min(float(header), _MAX_RETRY_AFTER)
+    return default
+
+
+def _failed_result(url: str, start_time: float, error: Exception) -> CrawlResult:
+    """CrawlResult for a page that could not be fetched."""
+    return CrawlResult(
+        url=url,
+        title="",
+        content="",
+        links=[],
+        meta_data={},
+        status_code=0,
+        load_time=time.time() - start_time,
+        error=str(error)
+    )
+
+
+def _child_text(elem, tag: str) -> Optional[str]:
+    """Text of a direct child element in any namespace, or None."""
+    child = elem.find(f'{{*}}{tag}')
+    if child is None or not child.text:
+        return None
+    return child.text.strip()
+
 
 class ContentAnalyzer:
     """Analyze content structure and quality."""
@@ -335,15 +522,14 @@ class ContentAnalyzer:
         word_count = len(words)
 
         # Readability metrics
-        sentences = re.split(r'[.!?]+', content)
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentence_count = len(_SENTENCE_RE.findall(content))
         avg_words_per_sentence = word_count / sentence_count if sentence_count > 0 else 0
 
         # Question detection for AI optimization
-        question_patterns = re.findall(r'\b(?:what|how|why|when|where|who)\b.*?\?', content, re.IGNORECASE)
+        question_patterns = _QUESTION_RE.findall(content)
 
         # Header structure simulation (would need parsed HTML)
-        headers_found = len(re.findall(r'\n[A-Z][^.]*\n', content))
+        headers_found = len(_HEADER_LINE_RE.findall(content))
 
         return {
             'word_count': word_count,
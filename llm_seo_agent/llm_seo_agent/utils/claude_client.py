@@ -1,24 +1,89 @@
 import asyncio
 import logging
 from typing import Dict, List, Optional, Any
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient
+import httpx
 import json
 import os
 from llm_seo_agent.utils.data_models import ToolResponse
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # h2 is an optional speedup (install the "fast" extra)
+    _HTTP2 = False
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Process-wide HTTP client for the Anthropic API.
+
+    Shared by every ClaudeClient so calls reuse warm keep-alive connections
+    (HTTP/2 multiplexed when h2 is installed). The pool is bound to the event
+    loop, so a new client is made if the loop changes.
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            http2=_HTTP2,
+        )
+        _http_client_loop = loop
+
+    return _http_client
+
+
+async def close_shared_http_client():
+    """Close the shared Anthropic HTTP client (call on application shutdown)."""
+    global _http_client, _http_client_loop
+
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
 
 class ClaudeClient:
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-5-20250929"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-5-20250929",
+                 fast_model: str = "claude-haiku-4-5-20251001"):
         self.api_key = api_key or os.getenv("CLAUDE_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Claude API key must be provided or set as CLAUDE_API_KEY or ANTHROPIC_API_KEY environment variable")
 
         self.client = Anthropic(api_key=self.api_key)
         self.model = model
+        self.fast_model = fast_model  # Cheaper, lower-latency model for simple replies
         self.logger = logging.getLogger(__name__)
 
+        self._async_client: Optional[AsyncAnthropic] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """Async client for use inside coroutines, so API calls don't block the event loop.
+
+        Connections come from the shared HTTP client; since that pool is bound
+        to the event loop, the client is recreated when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncAnthropic(
+                api_key=self.api_key, http_client=_shared_http_client()
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
     async def generate_response(self, user_message: str, context: str = "",
-                              system_prompt: str = "", tools: List[Dict] = None) -> str:
+                              system_prompt: str = "", tools: List[Dict] = None,
+                              model: Optional[str] = None) -> str:
         """Generate a response using Claude with conversation context."""
 
         messages = []
@@ -36,16 +101,16 @@ class ClaudeClient:
 
         try:
             if tools:
-                response = self.client.messages.create(
-                    model=self.model,
+                response = await self.async_client.messages.create(
+                    model=model or self.model,
                     max_tokens=4000,
                     system=system_prompt,
                     messages=messages,
                     tools=tools
                 )
             else:
-                response = self.client.messages.create(
-                    model=self.model,
+                response = await self.async_client.messages.create(
+                    model=model or self.model,
                     max_tokens=4000,
                     system=system_prompt,
                     messages=messages
@@ -172,7 +237,8 @@ class ClaudeClient:
             system_prompt=system_prompt
         )
 
-    async def casual_conversation(self, user_message: str, context: str) -> str:
+    async def casual_conversation(self, user_message: str, context: str,
+                                  model: Optional[str] = None) -> str:
         """Handle casual conversation without tools."""
 
         system_prompt = """
@@ -192,30 +258,55 @@ class ClaudeClient:
         return await self.generate_response(
             user_message=user_message,
             context=context,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            model=model
         )
 
-    async def generate_response_with_tools(self, user_message: str, context: str,
-                                          system_prompt: str, tools: List[Dict]) -> Any:
-        """Generate a response with tool calling support. Returns the raw response object."""
+    def build_messages(self, user_message: str, context: str = "",
+                       history: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, Any]]:
+        """Assemble API messages as [prior turns] + [context + current message].
+
+        Prior turns come first and the end of them is marked as a prompt-cache
+        breakpoint, so only the final user message changes between turns.
+        """
+        messages: List[Dict[str, Any]] = [dict(message) for message in history or []]
+
+        if messages:
+            last = messages[-1]
+            last["content"] = [{
+                "type": "text",
+                "text": last["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
 
-        messages = []
         if context:
-            messages.append({
-                "role": "user",
-                "content": f"Context from previous conversation:\n{context}\n\nCurrent message: {user_message}"
-            })
+            content = f"Context:\n{context}\n\nCurrent message: {user_message}"
         else:
-            messages.append({
-                "role": "user",
-                "content": user_message
-            })
+            content = user_message
+        messages.append({"role": "user", "content": content})
+
+        return messages
+
+    def cached_system(self, system_prompt: str) -> List[Dict[str, Any]]:
+        """Wrap a static system prompt as a cacheable system block."""
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    async def generate_response_with_tools(self, user_message: str, context: str,
+                                          system_prompt: str, tools: List[Dict],
+                                          history: Optional[List[Dict[str, str]]] = None) -> Any:
+        """Generate a response with tool calling support. Returns the raw response object."""
+
+        messages = self.build_messages(user_message, context, history)
 
         try:
-            response = self.client.messages.create(
+            response = await self.async_client.messages.create(
                 model=self.model,
                 max_tokens=4000,
-                system=system_prompt,
+                system=self.cached_system(system_prompt),
                 messages=messages,
                 tools=tools
             )
@@ -223,4 +314,4 @@ class ClaudeClient:
 
         except Exception as e:
             self.logger.error(f"Error generating response with tools: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -67,6 +67,7 @@ class ConversationSession(BaseModel):
     competitor_analyses: List[CompetitorAnalysis] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    last_checkin_ts: Optional[float] = None  # Epoch seconds of the last proactive check-in
 
 
 class AISearchMetrics(BaseModel):
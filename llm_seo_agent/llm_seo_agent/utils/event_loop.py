@@ -0,0 +1,45 @@
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+from llm_seo_agent.utils.claude_client import close_shared_http_client
+from llm_seo_agent.utils.http_session import close_shared_session
+
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup (install the "fast" extra)
+    uvloop = None
+
+T = TypeVar('T')
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, backed by uvloop when it is installed."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+
+    if sys.version_info >= (3, 12):
+        # Run new tasks synchronously until their first real suspension, so
+        # coroutines that finish immediately never round-trip the scheduler
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    return loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Drop-in replacement for asyncio.run() that uses new_event_loop()."""
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            return runner.run(_run_with_cleanup(main))
+
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(_run_with_cleanup(main))
+
+
+async def _run_with_cleanup(main: Coroutine[Any, Any, T]) -> T:
+    """Await the main coroutine, then release loop-bound shared resources."""
+    try:
+        return await main
+    finally:
+        await close_shared_session()
+        await close_shared_http_client()
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on first use.
+
+    Keeping one session alive lets requests reuse pooled keep-alive
+    connections (and skip repeated DNS lookups and TLS handshakes). A session
+    is bound to the event loop it was created on, so a new one is made if the
+    loop changes (e.g. one asyncio.run per Streamlit request).
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'User-Agent': 'SEO-Agent/1.0 (Educational purposes)'}
+        )
+        _session_loop = loop
+
+    return _session
+
+
+async def close_shared_session():
+    """Close the shared session (call on application shutdown)."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def read_text(response: aiohttp.ClientResponse, max_bytes: int) -> str:
+    """Read and decode at most max_bytes of a response body.
+
+    Streams the body so the rest of an oversized page is never downloaded.
+    """
+    chunks = []
+    total = 0
+    async for chunk in response.content.iter_chunked(65536):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+
+    body = b''.join(chunks)[:max_bytes]
+    try:
+        return body.decode(response.charset or 'utf-8', errors='replace')
+    except LookupError:  # Unknown charset in the Content-Type header
+        return body.decode('utf-8', errors='replace')
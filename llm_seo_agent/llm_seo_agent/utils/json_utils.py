@@ -0,0 +1,31 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (install the "fast" extra)
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available.
+
+    Datetimes are encoded natively; any other unsupported values (URLs, UUIDs
+    from older pydantic types, ...) fall back to ``str()``. Non-string dict
+    keys are stringified, as the stdlib encoder does.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -0,0 +1,214 @@
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def write_atomic(path: Path, payload: bytes):
+    """Replace a file's contents so readers never see a partial write (blocking)."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+class SessionWriteBatcher:
+    """Coalesce snapshot file writes from concurrent sessions into batches.
+
+    Writes queued within ``max_delay_ms`` of each other (or until
+    ``max_batch_size`` files are pending) are written together in one worker
+    thread hop. Payloads are whole-file snapshots, so only the latest payload
+    per path is kept, and a payload is skipped if a newer one for the same path
+    (queued later, or written directly with write_now) is already on disk.
+
+    It also appends lines to log files (``append``): those are written in order
+    by a drain task in a worker thread, and ``append_now`` writes whatever is
+    still queued for readers that need the logs complete on disk.
+    """
+
+    def __init__(self, max_delay_ms: int = 5, max_batch_size: int = 32):
+        self.max_delay_ms = max_delay_ms
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Path, Tuple[int, bytes]] = {}
+        self._waiters: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._last_flush: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Every payload gets a sequence number when it is handed in; a path's
+        # file only ever moves forward, whichever thread writes it
+        self._seq = 0
+        self._written_seq: Dict[Path, int] = {}
+        self._write_lock = threading.Lock()
+
+        # Log data waiting to be appended, per file, with an optional callback
+        # for failed writes; _append_lock guards the buffer and log_lock is held
+        # while log files are appended to (take it to move a log file aside)
+        self._appends: Dict[Path, List[bytes]] = {}
+        self._append_errors: Dict[Path, Callable[[], None]] = {}
+        self._append_lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        self._append_task: Optional[asyncio.Task] = None
+
+    async def write(self, path: Path, payload: bytes):
+        """Queue a file write and wait until the batch containing it is on disk."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # New event loop (e.g. one asyncio.run per request): anything left
+            # over from the previous loop can no longer be flushed by it
+            self._write_pending_now()
+            self._last_flush = None
+            self._loop = loop
+
+        waiter = loop.create_future()
+        self._pending[path] = (self._next_seq(), payload)
+        self._waiters.append(waiter)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay_ms / 1000, self._start_flush)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Loop is shutting down before the batch ran: write it synchronously
+            self._write_pending_now()
+            raise
+
+    def write_now(self, path: Path, payload: bytes):
+        """Write a file immediately (blocking), superseding queued writes to it."""
+        self._write_file(path, self._next_seq(), payload)
+
+    def append(self, path: Path, data: bytes, on_error: Optional[Callable[[], None]] = None):
+        """Queue data to append to a log file; it is written off the event loop.
+
+        on_error is called (on the event loop, when there is one) if the write fails.
+        """
+        with self._append_lock:
+            self._appends.setdefault(path, []).append(data)
+            if on_error is not None:
+                self._append_errors[path] = on_error
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync callers): write it now
+            self._report_failed(self.append_now())
+            return
+
+        task = self._append_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._append_task = loop.create_task(self._drain_appends())
+
+    async def wait_appends(self):
+        """Wait until every queued log line is on disk."""
+        task = self._append_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            await task
+        if self._appends:
+            self._report_failed(await asyncio.to_thread(self.append_now))
+
+    def append_now(self) -> List[Callable[[], None]]:
+        """Append all queued log data (blocking). Returns the error callbacks of failed files."""
+        failed = []
+        with self.log_lock:
+            with self._append_lock:
+                appends, self._appends = self._appends, {}
+                errors, self._append_errors = self._append_errors, {}
+
+            for path, chunks in appends.items():
+                try:
+                    with open(path, 'ab') as f:
+                        f.write(b"".join(chunks))
+                except Exception as e:
+                    print(f"Error appending to {path.name}: {e}")
+                    if path in errors:
+                        failed.append(errors[path])
+
+        return failed
+
+    async def _drain_appends(self):
+        """Append queued log data in a worker thread until none is left."""
+        try:
+            while self._appends:
+                self._report_failed(await asyncio.to_thread(self.append_now))
+        except asyncio.CancelledError:
+            # Cancelled at loop shutdown: write synchronously so no lines are lost
+            self.append_now()
+            raise
+
+    @staticmethod
+    def _report_failed(callbacks: List[Callable[[], None]]):
+        for on_error in callbacks:
+            on_error()
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _start_flush(self):
+        """Hand the pending writes to a flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        self._last_flush = self._loop.create_task(
+            self._flush(batch, waiters, self._last_flush)
+        )
+
+    async def _flush(
+        self,
+        batch: Dict[Path, Tuple[int, bytes]],
+        waiters: List[asyncio.Future],
+        previous: Optional[asyncio.Task],
+    ):
+        """Write one batch in a worker thread, after the previous batch finished."""
+        if previous is not None and not previous.done():
+            # Keep batches in order so an older snapshot never lands last
+            await asyncio.wait([previous])
+
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+        except asyncio.CancelledError:
+            self._write_batch(batch)
+            raise
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _write_pending_now(self):
+        """Synchronously write whatever is still queued."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        if batch:
+            self._write_batch(batch)
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _write_batch(self, batch: Dict[Path, Tuple[int, bytes]]):
+        """Write every file in a batch (blocking)."""
+        for path, (seq, payload) in batch.items():
+            self._write_file(path, seq, payload)
+
+    def _write_file(self, path: Path, seq: int, payload: bytes):
+        """Write one payload unless a newer one for the path already landed."""
+        with self._write_lock:
+            if self._written_seq.get(path, 0) > seq:
+                return
+            write_atomic(path, payload)
+            self._written_seq[path] = seq
@@ -0,0 +1,99 @@
+import asyncio
+
+from llm_seo_agent.agent.memory import ConversationMemory
+from llm_seo_agent.utils.data_models import ConversationRole, SEORecommendation, WebsiteAnalysis
+
+
+def _recommendation(rec_id: str) -> SEORecommendation:
+    return SEORecommendation(
+        id=rec_id, title=rec_id, description="", priority="high", category="content"
+    )
+
+
+def _small_window_memory(storage_path) -> ConversationMemory:
+    memory = ConversationMemory(storage_path=str(storage_path))
+    memory.window_size = 10
+    memory.compress_batch = 5
+    return memory
+
+
+def test_window_summarizes_archived_messages_across_reload(tmp_path):
+    memory = _small_window_memory(tmp_path)
+    session = memory.create_session("user")
+    for i in range(25):
+        memory.add_message(ConversationRole.USER, f"msg {i}")
+
+    assert len(session.messages) <= memory.window_size + 1
+    assert session.messages[0].role == ConversationRole.SYSTEM
+    assert memory.message_count() == 25
+
+    reloaded_memory = _small_window_memory(tmp_path)
+    reloaded = reloaded_memory.load_session(session.session_id)
+    summary, *window = reloaded.messages
+    assert summary.metadata["archived_messages"] + len(window) == 25
+    assert [m.content for m in window] == [f"msg {i}" for i in range(15, 25)]
+    assert reloaded_memory.message_count() == 25
+
+
+def test_load_session_replays_logged_events(tmp_path):
+    memory = ConversationMemory(storage_path=str(tmp_path))
+    session = memory.create_session("user")
+    memory.add_recommendation(_recommendation("R1"))
+    memory.add_recommendation(_recommendation("R2"))
+    memory.update_recommendation_status("R1", "completed")
+    memory.add_website_analysis(WebsiteAnalysis(url="https://example.com", title="Example"))
+
+    # Only the events log holds these changes; the snapshot is from create_session
+    assert not memory._dirty
+
+    reloaded = ConversationMemory(storage_path=str(tmp_path)).load_session(session.session_id)
+    statuses = {r.id: r.implementation_status for r in reloaded.recommendations}
+    assert statuses == {"R1": "completed", "R2": "pending"}
+    assert [a.title for a in reloaded.website_analyses] == ["Example"]
+
+
+def test_message_history_starts_on_user_turn(tmp_path):
+    memory = ConversationMemory(storage_path=str(tmp_path))
+    memory.create_session("user")
+    memory.add_message(ConversationRole.ASSISTANT, "welcome")
+    for i in range(5):
+        memory.add_message(ConversationRole.USER, f"question {i}")
+        memory.add_message(ConversationRole.ASSISTANT, f"answer {i}")
+
+    # The window would begin on "answer 2"; the history skips ahead to a user turn
+    history = memory.get_message_history(max_messages=5, align=1)
+    assert history[0] == {"role": "user", "content": "question 3"}
+    assert [m["role"] for m in history] == ["user", "assistant", "user", "assistant"]
+
+
+def test_export_includes_archived_messages(tmp_path):
+    memory = _small_window_memory(tmp_path)
+    memory.create_session("user")
+    for i in range(25):
+        memory.add_message(ConversationRole.USER, f"msg {i}")
+
+    # The report reads the full message log, not just the in-memory window
+    report_lines = memory.export_to_markdown(include_conversation=True).splitlines()
+    for i in range(25):
+        assert f"msg {i}" in report_lines
+
+
+def test_sync_save_is_not_overwritten_by_older_batched_save(tmp_path):
+    memory = ConversationMemory(storage_path=str(tmp_path))
+    session = memory.create_session("user")
+
+    async def interleave():
+        memory.add_recommendation(_recommendation("R1"))
+        flush = asyncio.create_task(memory.flush())
+        await asyncio.sleep(0)  # flush() is now waiting on the write batcher
+
+        memory.add_recommendation(_recommendation("R2"))
+        memory.update_user_profile(industry="retail")
+        memory._flush_now()
+        await flush
+
+    asyncio.run(interleave())
+
+    reloaded = ConversationMemory(storage_path=str(tmp_path)).load_session(session.session_id)
+    assert [r.id for r in reloaded.recommendations] == ["R1", "R2"]
+    assert reloaded.user_profile.industry == "retail"